@@ -0,0 +1,176 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+
+MANIFEST_NAME = "manifest.json"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+
+_sources: dict = {}
+
+
+def generator_key(generator, params: dict, version: int = 1) -> str:
+    """Hash a generator's source, parameters and code version into a cache key."""
+    source = _sources.get(generator)
+    if source is None:
+        # inspect.getsource re-tokenizes the module every call; slide fingerprints ask once per slide.
+        try:
+            source = inspect.getsource(generator)
+        except (OSError, TypeError):
+            source = generator.__code__.co_code.hex()
+        _sources[generator] = source
+    payload = json.dumps(
+        {
+            "generator": generator.__qualname__,
+            "source": source,
+            "params": params,
+            "version": version,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=list,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class AssetCache:
+    """Content-addressed store of rendered assets with a JSON manifest.
+
+    Entries live at ``<root>/<key><suffix>``. The manifest tracks size and last
+    use for LRU eviction, plus which key was last copied to each output path so
+    warm runs skip the copy as well as the render.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.entries: dict[str, dict] = {}
+        self.materialized: dict[str, str] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self.entries = data.get("entries", {})
+        self.materialized = data.get("materialized", {})
+
+    def save(self):
+        data = {"entries": self.entries, "materialized": self.materialized}
+        tmp_path = self.manifest_path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def path_for(self, key: str, suffix: str) -> Path:
+        return self.root / f"{key}{suffix}"
+
+    def lookup(self, key: str) -> Path | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        path = self.root / entry["file"]
+        if not path.exists():
+            del self.entries[key]
+            return None
+        entry["last_used"] = time.time()
+        return path
+
+    def store(self, key: str, name: str, path: Path):
+        self.entries[key] = {
+            "name": name,
+            "file": path.name,
+            "bytes": path.stat().st_size,
+            "last_used": time.time(),
+        }
+
+    def materialize(self, key: str, dest: Path) -> bool:
+        """Copy a cached entry to ``dest`` unless it already holds that entry."""
+        source = self.root / self.entries[key]["file"]
+        marker = str(dest)
+        if (
+            self.materialized.get(marker) == key
+            and dest.exists()
+            and dest.stat().st_size == self.entries[key]["bytes"]
+        ):
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, dest)
+        self.materialized[marker] = key
+        return True
+
+    def total_bytes(self) -> int:
+        return sum(entry["bytes"] for entry in self.entries.values())
+
+    def evict(self, keep=()) -> list[str]:
+        """Drop missing and stale entries, then least-recently-used ones over the size cap."""
+        keep = set(keep)
+        cutoff = time.time() - self.max_age
+        evicted = []
+        for key, entry in list(self.entries.items()):
+            path = self.root / entry["file"]
+            if not path.exists():
+                del self.entries[key]
+                evicted.append(key)
+            elif key not in keep and entry["last_used"] < cutoff:
+                path.unlink(missing_ok=True)
+                del self.entries[key]
+                evicted.append(key)
+
+        total = self.total_bytes()
+        by_age = sorted(self.entries.items(), key=lambda item: item[1]["last_used"])
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            (self.root / entry["file"]).unlink(missing_ok=True)
+            del self.entries[key]
+            total -= entry["bytes"]
+            evicted.append(key)
+
+        live = set(self.entries)
+        self.materialized = {dest: key for dest, key in self.materialized.items() if key in live}
+        return evicted
+
+
+def prune_directory(root: Path, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE) -> list[Path]:
+    """Evict files under ``root`` with :meth:`AssetCache.evict`'s policy, using mtime as last use.
+
+    For caches written by many processes at once (image variants, thumbnails),
+    where a shared manifest would lose entries; readers refresh a hit's mtime.
+    """
+    try:
+        # In-progress .tmp writes belong to other processes and are left alone.
+        files = [(path, path.stat()) for path in Path(root).iterdir() if path.is_file() and path.suffix != ".tmp"]
+    except OSError:
+        return []
+    cutoff = time.time() - max_age
+    evicted = [path for path, stat in files if stat.st_mtime < cutoff]
+    live = sorted((item for item in files if item[1].st_mtime >= cutoff), key=lambda item: item[1].st_mtime)
+    total = sum(stat.st_size for _, stat in live)
+    for path, stat in live:
+        if total <= max_bytes:
+            break
+        evicted.append(path)
+        total -= stat.st_size
+    for path in evicted:
+        path.unlink(missing_ok=True)
+    return evicted
+
+
+def touch(path: Path):
+    """Mark a cache file as just used for :func:`prune_directory`."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
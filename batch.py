@@ -0,0 +1,140 @@
+import argparse
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import tracing
+from deck_spec import iter_raw_specs, normalize_spec
+from generate_presentation import build_deck, ensure_assets, resolve_workers
+
+
+# Specs held in flight per worker; keeps huge JSONL streams from being read into memory at once.
+QUEUE_DEPTH = 4
+
+
+def build_one(spec: dict, output_path: Path, trace: bool = False) -> dict:
+    started = time.perf_counter()
+    result = {"name": spec["name"], "output": str(output_path)}
+    tracer = tracing.start() if trace else None
+    try:
+        prs = build_deck(spec)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with tracing.span("save", slides=len(prs.slides)):
+            prs.save(output_path)
+        result.update(ok=True, bytes=output_path.stat().st_size)
+    except Exception as exc:
+        result.update(ok=False, error=f"{type(exc).__name__}: {exc}", traceback=traceback.format_exc())
+    finally:
+        if tracer:
+            tracing.stop()
+    if tracer and result["ok"]:
+        tracer.write(output_path)
+    result["seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def iter_jobs(source: str, out_dir: Path):
+    """Yield ``(spec, output_path)`` jobs, or a failed result dict for specs that do not parse."""
+    for name, raw in iter_raw_specs(source):
+        try:
+            if isinstance(raw, Exception):
+                raise raw
+            spec = normalize_spec(raw, name=name)
+        except Exception as exc:
+            # One bad spec is that deck's failure; the rest of the batch still builds.
+            yield {"name": name, "ok": False, "error": f"invalid spec: {exc}", "seconds": 0.0}
+            continue
+        yield spec, out_dir / spec["output"]
+
+
+def run_batch(
+    source: str,
+    out_dir: Path,
+    workers: int | None = None,
+    asset_workers: int | None = None,
+    trace: bool = False,
+):
+    started = time.perf_counter()
+    ensure_assets(workers=asset_workers)
+    workers = resolve_workers(workers)
+    results = []
+
+    def record(result):
+        results.append(result)
+        status = "ok " if result["ok"] else "ERR"
+        detail = result.get("output") if result["ok"] else result["error"]
+        print(f"{status} {result['seconds']:8.3f}s  {result['name']}  {detail}", flush=True)
+
+    if workers == 1:
+        for job in iter_jobs(source, out_dir):
+            record(job if isinstance(job, dict) else build_one(*job, trace=trace))
+    else:
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for job in iter_jobs(source, out_dir):
+                if isinstance(job, dict):
+                    record(job)
+                    continue
+                pending.add(pool.submit(build_one, *job, trace=trace))
+                if len(pending) >= workers * QUEUE_DEPTH:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record(future.result())
+            for future in wait(pending).done:
+                record(future.result())
+
+    failed = [result for result in results if not result["ok"]]
+    report = {
+        "source": source,
+        "workers": workers,
+        "decks": len(results),
+        "failed": len(failed),
+        "seconds": round(time.perf_counter() - started, 4),
+        "results": sorted(results, key=lambda result: result["name"]),
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "batch_report.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Built {len(results) - len(failed)}/{len(results)} decks in {report['seconds']:.2f}s")
+    return report
+
+
+def check_specs(source: str, out_dir: Path) -> int:
+    """List every spec with its slide count and output path without building anything."""
+    failed = 0
+    for job in iter_jobs(source, out_dir):
+        if isinstance(job, dict):
+            failed += 1
+            print(f"ERR {job['name']}  {job['error']}")
+        else:
+            spec, output_path = job
+            print(f"ok  {spec['name']}  {len(spec['slides'])} slides -> {output_path}")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build many decks from JSON specs with a shared asset set.")
+    parser.add_argument("source", help="directory of *.json specs, a .jsonl file, or - for JSONL on stdin")
+    parser.add_argument("--out-dir", type=Path, default=Path("decks"), help="where decks and batch_report.json go")
+    parser.add_argument("--workers", type=int, default=0, help="deck build processes (0 = one per CPU)")
+    parser.add_argument("--asset-workers", type=int, default=0, help="asset render processes (0 = one per CPU)")
+    parser.add_argument("--trace", action="store_true", help="write timing spans next to each deck")
+    parser.add_argument("--check", action="store_true", help="validate and list specs without building decks")
+    args = parser.parse_args(argv)
+    if args.check:
+        return 1 if check_specs(args.source, args.out_dir) else 0
+    report = run_batch(
+        args.source,
+        args.out_dir,
+        workers=args.workers,
+        asset_workers=args.asset_workers,
+        trace=args.trace,
+    )
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+DEFAULT_BASELINE = Path("benchmarks") / "baseline.json"
+# A metric regresses when it grows by more than this fraction over the baseline...
+DEFAULT_TOLERANCE = 0.2
+# ...and by more than this absolute amount, so millisecond stages do not flag on scheduler noise.
+NOISE_FLOORS = {".seconds": 0.025, "_ms": 1.0, "_kb": 4096, ".bytes": 0}
+
+
+def peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def bench_assets(repeat: int) -> dict:
+    from generate_presentation import ASSET_SPECS
+
+    metrics = {}
+    for filename, (generator, params) in ASSET_SPECS.items():
+        path = Path(filename)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            generator(path, **params)
+            timings.append(time.perf_counter() - started)
+        metrics[f"assets.{path.stem}.seconds"] = min(timings)
+        metrics[f"assets.{path.stem}.bytes"] = path.stat().st_size
+    metrics["assets.peak_rss_kb"] = peak_rss_kb()
+    return metrics
+
+
+def bench_deck(slide_count: int, repeat: int = 3) -> dict:
+    """Build a ``slide_count`` deck ``repeat`` times and keep each stage's fastest run."""
+    from generate_presentation import ensure_assets
+
+    ensure_assets()
+    runs = [_deck_run(slide_count) for _ in range(repeat)]
+    metrics = {key: min(run[key] for run in runs) for key in runs[0]}
+    metrics[f"deck.{slide_count}.peak_rss_kb"] = peak_rss_kb()
+    return metrics
+
+
+def _deck_run(slide_count: int) -> dict:
+    from deck_spec import normalize_slide
+    from generate_presentation import SLIDES_DATA, add_bullet_slide, add_title_slide, resolve_image
+    from templates import new_presentation
+
+    slides = [normalize_slide(SLIDES_DATA[idx % len(SLIDES_DATA)]) for idx in range(slide_count)]
+    prefix = f"deck.{slide_count}"
+    metrics = {}
+
+    started = time.perf_counter()
+    prs = new_presentation()
+    metrics[f"{prefix}.template.seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    add_title_slide(prs)
+    metrics[f"{prefix}.add_title_slide.seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for slide in slides:
+        add_bullet_slide(prs, slide["title"], slide["bullets"], resolve_image(slide["image"]), chart=slide.get("chart"))
+    elapsed = time.perf_counter() - started
+    metrics[f"{prefix}.add_bullet_slide.seconds"] = elapsed
+    metrics[f"{prefix}.add_bullet_slide.per_slide_ms"] = elapsed / slide_count * 1000
+
+    output_path = Path("bench.pptx")
+    started = time.perf_counter()
+    prs.save(output_path)
+    metrics[f"{prefix}.save.seconds"] = time.perf_counter() - started
+    metrics[f"{prefix}.bytes"] = output_path.stat().st_size
+    return metrics
+
+
+def _run_case(case: str, arg: int, repeat: int) -> dict:
+    # Each case runs in a fresh process inside its own scratch directory so peak RSS
+    # and caches are not inherited from earlier cases.
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        os.chdir(workdir)
+        return bench_assets(repeat) if case == "assets" else bench_deck(arg, repeat)
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat: int = 5) -> dict:
+    import PIL
+    import pptx
+
+    cases = [("assets", None)] + [("deck", size) for size in sizes]
+    metrics = {}
+    for case, arg in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(_run_case, case, arg, repeat).result()
+        metrics.update(result)
+        label = case if case == "assets" else f"{arg} slides"
+        print(f"  {label:<12} done", flush=True)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "python-pptx": pptx.__version__,
+            "Pillow": PIL.__version__,
+        },
+        "metrics": metrics,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    regressions = []
+    for key, value in sorted(current["metrics"].items()):
+        before = baseline["metrics"].get(key)
+        if before is None:
+            continue
+        change = (value - before) / before if before else 0.0
+        floor = next((floor for suffix, floor in NOISE_FLOORS.items() if key.endswith(suffix)), 0)
+        flag = "REGRESSION" if change > tolerance and value - before > floor else ""
+        print(f"{key:<48} {before:>14.4f} {value:>14.4f} {change:>+8.1%} {flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time asset rendering, slide building and save across deck sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="slide counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per asset generator and deck size (fastest is kept)")
+    parser.add_argument("--output", type=Path, help="write this run's results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed growth before a metric regresses")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        for key, value in sorted(results["metrics"].items()):
+            print(f"{key:<48} {value:>14.4f}")
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    print(f"{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
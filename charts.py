@@ -0,0 +1,214 @@
+import importlib.util
+import io
+import sys
+
+
+CHART_TYPES = {
+    "bar": "COLUMN_CLUSTERED",
+    "hbar": "BAR_CLUSTERED",
+    "line": "LINE_MARKERS",
+    "pie": "PIE",
+}
+SERIES_COLORS = ("b26b2a", "704214", "f2c94c", "2e7d32", "bf360c")
+HEADER_COLOR = "704214"
+# Pixel size of a chart drawn as a picture, matching the 3.8in x 2.4in chart box at 300 DPI.
+RASTER_SIZE = (1140, 720)
+
+
+def resolve_chart_mode(mode: str) -> str:
+    """Fall back to raster charts, with a warning, when XlsxWriter (needed for chart workbooks) is missing."""
+    if mode == "native" and importlib.util.find_spec("xlsxwriter") is None:
+        print("warning: XlsxWriter is not installed; drawing charts as pictures instead of native charts", file=sys.stderr)
+        return "raster"
+    return mode
+
+
+def validate_chart(chart: dict) -> dict:
+    """Check a slide's ``chart`` entry and return a normalized copy."""
+    if not isinstance(chart, dict):
+        raise ValueError(f"chart must be an object, got {type(chart).__name__}")
+    kind = chart.get("type", "bar")
+    if kind == "table":
+        columns, rows = chart.get("columns", []), chart.get("rows", [])
+        if not _is_list(columns) or not _is_list(rows) or not all(_is_list(row) for row in rows):
+            raise ValueError("table charts need a list of columns and a list of row lists")
+        columns = [str(column) for column in columns]
+        rows = [[str(cell) for cell in row] for row in rows]
+        if not columns or any(len(row) != len(columns) for row in rows):
+            raise ValueError("table charts need columns and rows of the same width")
+        return {"type": "table", "columns": columns, "rows": rows}
+    if not isinstance(kind, str) or kind not in CHART_TYPES:
+        raise ValueError(f"unknown chart type {kind!r}; expected one of {sorted(CHART_TYPES) + ['table']}")
+    categories, series = chart.get("categories", []), chart.get("series", {})
+    if not _is_list(categories) or not isinstance(series, dict) or not all(_is_list(values) for values in series.values()):
+        raise ValueError("charts need a list of categories and a series object mapping names to value lists")
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for values in series.values() for value in values):
+        raise ValueError("chart series values must be numbers")
+    categories = [str(category) for category in categories]
+    series = {str(name): [float(value) for value in values] for name, values in series.items()}
+    if not categories or not series or any(len(values) != len(categories) for values in series.values()):
+        raise ValueError("charts need categories and series with one value per category")
+    if chart.get("title") is not None and not isinstance(chart["title"], str):
+        raise ValueError("chart title must be a string")
+    return {"type": kind, "title": chart.get("title"), "categories": categories, "series": series}
+
+
+def _is_list(value) -> bool:
+    return isinstance(value, (list, tuple))
+
+
+def add_chart(slide, chart: dict, left, top, width, height):
+    if chart["type"] == "table":
+        return add_table(slide, chart, left, top, width, height)
+    return add_series_chart(slide, chart, left, top, width, height)
+
+
+def add_series_chart(slide, chart: dict, left, top, width, height):
+    from pptx.chart.data import CategoryChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+    from pptx.util import Pt
+
+    data = CategoryChartData()
+    data.categories = chart["categories"]
+    for name, values in chart["series"].items():
+        data.add_series(name, values)
+    chart_type = getattr(XL_CHART_TYPE, CHART_TYPES[chart["type"]])
+    graphic = slide.shapes.add_chart(chart_type, left, top, width, height, data).chart
+
+    graphic.font.size = Pt(12)
+    graphic.has_title = bool(chart.get("title"))
+    if graphic.has_title:
+        graphic.chart_title.text_frame.text = chart["title"]
+    graphic.has_legend = len(chart["series"]) > 1 or chart["type"] == "pie"
+    if graphic.has_legend:
+        graphic.legend.position = XL_LEGEND_POSITION.BOTTOM
+        graphic.legend.include_in_layout = False
+    if chart["type"] != "pie":
+        for idx, series in enumerate(graphic.plots[0].series):
+            fill = series.format.fill if chart["type"] != "line" else series.format.line.fill
+            fill.solid()
+            fill.fore_color.rgb = RGBColor.from_string(SERIES_COLORS[idx % len(SERIES_COLORS)])
+    return graphic
+
+
+def add_table(slide, chart: dict, left, top, width, height):
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
+    rows = [chart["columns"]] + chart["rows"]
+    table = slide.shapes.add_table(len(rows), len(chart["columns"]), left, top, width, height).table
+    for ridx, row in enumerate(rows):
+        for cidx, value in enumerate(row):
+            cell = table.cell(ridx, cidx)
+            cell.text = value
+            for paragraph in cell.text_frame.paragraphs:
+                paragraph.font.size = Pt(12)
+                paragraph.font.bold = ridx == 0
+            if ridx == 0:
+                cell.fill.solid()
+                cell.fill.fore_color.rgb = RGBColor.from_string(HEADER_COLOR)
+    return table
+
+
+def draw_chart(draw, box, chart: dict, font=None):
+    """Draw ``chart`` into the pixel ``box`` of a Pillow ``ImageDraw``; with ``font``, label it too.
+
+    Bars, a line or a pie show the first series; tables are a grid. Used for
+    raster charts and, without labels, for slide thumbnails.
+    """
+    x0, y0, x1, y1 = box
+    if chart["type"] == "table":
+        rows = [chart["columns"]] + chart["rows"]
+        row_h = (y1 - y0) / len(rows)
+        col_w = (x1 - x0) / len(chart["columns"])
+        draw.rectangle([x0, y0, x1, y0 + row_h], fill=f"#{HEADER_COLOR}")
+        for ridx in range(len(rows) + 1):
+            draw.line([x0, y0 + ridx * row_h, x1, y0 + ridx * row_h], fill="#7f7f7f")
+        for cidx in range(len(chart["columns"]) + 1):
+            draw.line([x0 + cidx * col_w, y0, x0 + cidx * col_w, y1], fill="#7f7f7f")
+        if font:
+            for ridx, row in enumerate(rows):
+                for cidx, value in enumerate(row):
+                    anchor = (x0 + (cidx + 0.5) * col_w, y0 + (ridx + 0.5) * row_h)
+                    draw.text(anchor, value, fill="#ffffff" if ridx == 0 else "#000000", font=font, anchor="mm")
+        return
+    values = next(iter(chart["series"].values()))
+    labels = chart["categories"]
+    peak = max(max(values), 1e-9)
+    if chart["type"] == "pie":
+        total, angle = sum(values) or 1.0, -90.0
+        side = min(x1 - x0, y1 - y0)
+        bounds = [x0, y0, x0 + side, y0 + side]
+        for idx, value in enumerate(values):
+            color = f"#{SERIES_COLORS[idx % len(SERIES_COLORS)]}"
+            sweep = 360.0 * value / total
+            draw.pieslice(bounds, angle, angle + sweep, fill=color)
+            angle += sweep
+            if font:
+                # Legend to the right of the pie.
+                row_y = y0 + idx * _font_size(font) * 1.5
+                draw.rectangle([x0 + side + 20, row_y, x0 + side + 20 + _font_size(font), row_y + _font_size(font)], fill=color)
+                draw.text((x0 + side + 30 + _font_size(font), row_y), labels[idx], fill="#000000", font=font)
+        return
+    color = f"#{SERIES_COLORS[0]}"
+    if font:
+        # Leave room for category labels below the axis (or beside it for horizontal bars).
+        if chart["type"] == "hbar":
+            x0 += max(font.getlength(label) for label in labels) + 10
+        else:
+            y1 -= _font_size(font) * 1.5
+    step = (x1 - x0) / len(values)
+    if chart["type"] == "line":
+        points = [(x0 + step * (idx + 0.5), y1 - (y1 - y0) * value / peak) for idx, value in enumerate(values)]
+        draw.line(points, fill=color, width=max(2, round((x1 - x0) / 200)))
+    elif chart["type"] == "hbar":
+        bar = (y1 - y0) / len(values)
+        for idx, value in enumerate(values):
+            draw.rectangle([x0, y0 + bar * idx + bar * 0.2, x0 + (x1 - x0) * value / peak, y0 + bar * (idx + 0.8)], fill=color)
+            if font:
+                draw.text((x0 - 10, y0 + bar * (idx + 0.5)), labels[idx], fill="#000000", font=font, anchor="rm")
+        draw.line([x0, y0, x0, y1], fill="#7f7f7f")
+        return
+    else:
+        for idx, value in enumerate(values):
+            draw.rectangle([x0 + step * idx + step * 0.2, y1 - (y1 - y0) * value / peak, x0 + step * (idx + 0.8), y1], fill=color)
+    if font:
+        for idx, label in enumerate(labels):
+            draw.text((x0 + step * (idx + 0.5), y1 + 6), label, fill="#000000", font=font, anchor="ma")
+    draw.line([x0, y1, x1, y1], fill="#7f7f7f")
+
+
+def _font_size(font) -> int:
+    # Pillow's bitmap fallback font has no size attribute.
+    return getattr(font, "size", 11)
+
+
+_raster_charts: dict[str, bytes] = {}
+
+
+def render_chart(chart: dict, size: tuple[int, int] = RASTER_SIZE) -> bytes:
+    """PNG picture of ``chart`` drawn from its own data, for raster chart mode; memoized per process."""
+    import json
+
+    key = json.dumps([chart, size], sort_keys=True)
+    if key not in _raster_charts:
+        from PIL import Image, ImageDraw
+
+        from fonts import FONTS
+
+        width, height = size
+        img = Image.new("RGB", size, "#ffffff")
+        draw = ImageDraw.Draw(img)
+        font = FONTS.get(max(12, height // 24), "DejaVuSans.ttf")
+        top = height // 20
+        if chart.get("title"):
+            title_font = FONTS.get(max(16, height // 14))
+            draw.text((width / 2, top), chart["title"], fill="#000000", font=title_font, anchor="ma")
+            top += _font_size(title_font) * 2
+        margin = width // 20
+        draw_chart(draw, (margin, top, width - margin, height - height // 20), chart, font=font)
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", optimize=True)
+        _raster_charts[key] = buffer.getvalue()
+    return _raster_charts[key]
@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+from charts import validate_chart
+
+
+TITLE_FIELDS = ("title", "subtitle", "presenter", "background", "logo")
+
+
+def normalize_slide(slide) -> dict:
+    """Accept a ``(title, bullets, image[, chart])`` tuple or a mapping with those keys."""
+    if isinstance(slide, dict):
+        title, bullets, image = slide.get("title"), slide.get("bullets", []), slide.get("image")
+        chart = slide.get("chart")
+    elif isinstance(slide, (list, tuple)) and 3 <= len(slide) <= 4:
+        title, bullets, image, *rest = slide
+        chart = rest[0] if rest else None
+    else:
+        raise ValueError(f"slide must be an object or a [title, bullets, image] list, got {slide!r:.60}")
+    if not isinstance(title, str) or not title:
+        raise ValueError(f"slide title must be a non-empty string, got {title!r}")
+    if not isinstance(bullets, (list, tuple)) or not all(isinstance(bullet, str) for bullet in bullets):
+        raise ValueError(f"bullets for slide {title!r} must be a list of strings")
+    if image is not None and not isinstance(image, (str, os.PathLike)):
+        raise ValueError(f"image for slide {title!r} must be a string, got {type(image).__name__}")
+    normalized = {"title": title, "bullets": list(bullets), "image": str(image) if image else None}
+    if chart:
+        normalized["chart"] = validate_chart(chart)
+    return normalized
+
+
+def normalize_spec(spec: dict, name: str | None = None) -> dict:
+    if not isinstance(spec, dict):
+        raise ValueError(f"deck spec must be a JSON object, got {type(spec).__name__}")
+    normalized = {field: spec[field] for field in TITLE_FIELDS if spec.get(field) is not None}
+    for field in (*TITLE_FIELDS, "output", "template"):
+        if spec.get(field) is not None and not isinstance(spec[field], (str, os.PathLike)):
+            raise ValueError(f"{field} must be a string, got {type(spec[field]).__name__}")
+    if not isinstance(spec.get("slides", []), list):
+        raise ValueError(f"slides must be a list, got {type(spec['slides']).__name__}")
+    normalized["name"] = str(spec.get("name") or name or normalized.get("title") or "deck")
+    normalized["output"] = spec.get("output") or f"{normalized['name']}.pptx"
+    if spec.get("template"):
+        normalized["template"] = str(spec["template"])
+    normalized["slides"] = [normalize_slide(slide) for slide in spec.get("slides", [])]
+    return normalized
+
+
+def iter_raw_specs(source: str):
+    """Yield ``(name, spec)`` pairs from a directory of .json files, a JSONL file, or ``-`` for stdin.
+
+    A malformed entry is yielded as its ``ValueError`` so one bad line does not
+    abort the rest of the stream.
+    """
+    if source == "-":
+        yield from _iter_jsonl(sys.stdin, "stdin")
+        return
+    path = Path(source)
+    if path.is_dir():
+        for spec_path in sorted(path.glob("*.json")):
+            yield spec_path.stem, _load_json(spec_path.read_text(encoding="utf-8"))
+    elif path.suffix == ".json":
+        yield path.stem, _load_json(path.read_text(encoding="utf-8"))
+    else:
+        with path.open(encoding="utf-8") as handle:
+            yield from _iter_jsonl(handle, path.stem)
+
+
+def iter_slides(path: Path):
+    """Lazily yield slide specs from a JSONL file, one ``[title, bullets, image]`` or object per line."""
+    with Path(path).open(encoding="utf-8") as handle:
+        for lineno, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"{path}:{lineno}: {exc}") from None
+
+
+def _iter_jsonl(handle, prefix: str):
+    for lineno, line in enumerate(handle, start=1):
+        if line.strip():
+            yield f"{prefix}-{lineno}", _load_json(line)
+
+
+def _load_json(text: str):
+    try:
+        return json.loads(text)
+    except ValueError as exc:
+        return exc
@@ -0,0 +1,101 @@
+DEFAULT_FAMILY = "DejaVuSans-Bold.ttf"
+MAX_MEASUREMENTS = 8192
+# Glyph advances are measured once at this pixel size and scaled linearly.
+ADVANCE_SIZE = 200
+
+
+class FontRegistry:
+    """Resolves font files once and caches loaded fonts and text measurements.
+
+    Families are file names (or paths) as accepted by ``ImageFont.truetype``.
+    A family that cannot be found falls back to Pillow's built-in bitmap font,
+    and that failed lookup is remembered too.
+    """
+
+    def __init__(self, max_measurements: int = MAX_MEASUREMENTS):
+        self.max_measurements = max_measurements
+        self._paths: dict[str, str | None] = {}
+        self._fonts: dict[tuple[str, int], object] = {}
+        self._bboxes: dict[tuple[str, int, str], tuple[int, int, int, int]] = {}
+        self._advances: dict[str, dict[str, float]] = {}
+        self._scratch = None
+
+    def register(self, family: str, path: str):
+        self._paths[family] = str(path)
+        self._fonts = {key: font for key, font in self._fonts.items() if key[0] != family}
+        self._bboxes = {key: bbox for key, bbox in self._bboxes.items() if key[0] != family}
+        self._advances.pop(family, None)
+
+    def resolve(self, family: str = DEFAULT_FAMILY) -> str | None:
+        if family not in self._paths:
+            from PIL import ImageFont
+
+            try:
+                # Let Pillow walk the system font directories once, then keep the hit.
+                self._paths[family] = ImageFont.truetype(family, 10).path
+            except OSError:
+                self._paths[family] = None
+        return self._paths[family]
+
+    def get(self, size: int, family: str = DEFAULT_FAMILY):
+        key = (family, size)
+        font = self._fonts.get(key)
+        if font is None:
+            from PIL import ImageFont
+
+            path = self.resolve(family)
+            if path:
+                font = ImageFont.truetype(path, size)
+            else:
+                try:
+                    # Pillow's built-in scalable font; text_width() relies on the size being honoured.
+                    font = ImageFont.load_default(size=size)
+                except (TypeError, ImportError, OSError):
+                    # Pillow < 10.1 or no FreeType: a fixed-size bitmap font.
+                    font = ImageFont.load_default()
+            self._fonts[key] = font
+        return font
+
+    def text_bbox(self, text: str, size: int, family: str = DEFAULT_FAMILY) -> tuple[int, int, int, int]:
+        key = (family, size, text)
+        bbox = self._bboxes.get(key)
+        if bbox is None:
+            if self._scratch is None:
+                from PIL import Image, ImageDraw
+
+                self._scratch = ImageDraw.Draw(Image.new("L", (1, 1)))
+            bbox = self._scratch.multiline_textbbox((0, 0), text, font=self.get(size, family))
+            if len(self._bboxes) >= self.max_measurements:
+                self._bboxes.clear()
+            self._bboxes[key] = bbox
+        return bbox
+
+    def text_width(self, text: str, size: float, family: str = DEFAULT_FAMILY) -> float:
+        """Advance width of ``text`` at ``size`` (result is in the unit of ``size``), ignoring kerning.
+
+        Each glyph's advance is measured once per family and kept as a fraction
+        of the em, so any size and any string reuse the same table.
+        """
+        table = self._advances.setdefault(family, {})
+        width = 0.0
+        for char in text:
+            advance = table.get(char)
+            if advance is None:
+                advance = table[char] = self.get(ADVANCE_SIZE, family).getlength(char) / ADVANCE_SIZE
+            width += advance
+        return width * size
+
+    def scalable(self, family: str = DEFAULT_FAMILY) -> bool:
+        """Whether ``family`` renders and measures at the requested size (not the bitmap fallback)."""
+        from PIL import ImageFont
+
+        return isinstance(self.get(ADVANCE_SIZE, family), ImageFont.FreeTypeFont)
+
+    def clear(self):
+        self._paths.clear()
+        self._fonts.clear()
+        self._bboxes.clear()
+        self._advances.clear()
+
+
+FONTS = FontRegistry()
@@ -1,40 +1,141 @@
+from __future__ import annotations
+
+import time
+
+_MODULE_STARTED = time.perf_counter()
+
+import argparse
+import functools
+import importlib
+import io
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
 
-from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt
-from PIL import Image, ImageDraw, ImageFont
+import tracing
+from asset_cache import DEFAULT_MAX_BYTES, AssetCache, generator_key, prune_directory
+from charts import add_chart, render_chart, resolve_chart_mode
+from deck_spec import iter_slides, normalize_slide, normalize_spec
+from fonts import FONTS
+from images import ImageBlob, fit_image, fit_image_bytes
+from incremental import build_incremental, file_hash, template_fingerprint
+from overflow import OVERFLOW_MODES, check_slide, text_family
+from reproducible import build_date_time, save_reproducible
+from streaming import stream_deck
+from templates import new_presentation
+from variants import build_variants, load_string_tables
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
 
 
 ASSETS_DIR = Path("assets")
+CACHE_DIR = Path(".asset_cache")
+# Bump when shared drawing helpers (base_canvas, load_font) change output.
+ASSET_CODE_VERSION = 1
+# Resolution pictures are downscaled to for their placed size; None embeds originals.
+IMAGE_DPI = 150
+# "native" emits slide charts as PowerPoint chart/table shapes; "raster" embeds their images.
+CHART_MODE = "native"
+# Seconds spent importing heavy dependencies, filled in as code paths first need them.
+IMPORT_SECONDS: dict[str, float] = {}
+
+
+def timed_import(name: str):
+    """Import ``name`` on first use, recording how long it took for ``--timings``."""
+    module = sys.modules.get(name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_SECONDS[name] = time.perf_counter() - started
+    return module
+
+
+def resolve_workers(workers: int | None) -> int:
+    if not workers or workers < 0:
+        return os.cpu_count() or 1
+    return workers
+
 
+def ensure_assets(
+    assets_dir: Path = ASSETS_DIR,
+    cache_dir: Path = CACHE_DIR,
+    max_cache_bytes: int = DEFAULT_MAX_BYTES,
+    workers: int | None = 1,
+    names=None,
+):
+    with tracing.span("ensure_assets"):
+        cache = AssetCache(cache_dir, max_bytes=max_cache_bytes)
+        keys = {filename: generator_key(gen, params, ASSET_CODE_VERSION) for filename, (gen, params) in ASSET_SPECS.items()}
+        wanted = [filename for filename in ASSET_SPECS if names is None or filename in names]
+        jobs = [
+            (*ASSET_SPECS[filename], cache.path_for(keys[filename], Path(filename).suffix))
+            for filename in wanted
+            if cache.lookup(keys[filename]) is None
+        ]
+        render_assets(jobs, workers)
 
-def ensure_assets():
-    ASSETS_DIR.mkdir(exist_ok=True)
-    create_cafe_background(ASSETS_DIR / "cafe_background.jpg")
-    create_college_logo(ASSETS_DIR / "college_logo.png")
-    create_industry_graphic(ASSETS_DIR / "industry_graphic.png")
-    create_comparison_chart(ASSETS_DIR / "comparison_chart.png")
-    create_busy_cafe_visual(ASSETS_DIR / "busy_cafe.png")
-    create_objective_icon(ASSETS_DIR / "objectives.png")
+        paths = {}
+        for filename in wanted:
+            key = keys[filename]
+            if key not in cache.entries:
+                cache.store(key, filename, cache.path_for(key, Path(filename).suffix))
+            paths[filename] = assets_dir / filename
+            cache.materialize(key, paths[filename])
+        cache.evict(keep=keys.values())
+        cache.save()
+        prune_directory(cache_dir / "variants", max_bytes=max_cache_bytes)
+    return paths
+
+
+def _render_asset(job):
+    generator, params, path = job
+    started = time.perf_counter_ns()
+    generator(path, **params)
+    return generator.__name__, started, time.perf_counter_ns() - started, os.getpid()
+
+
+def render_assets(jobs: list, workers: int | None = 1):
+    if not jobs:
+        return
+    workers = min(resolve_workers(workers), len(jobs))
+    timed_import("PIL.Image")
+    timings = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                timings = list(pool.map(_render_asset, jobs))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool here (sandboxed /dev/shm, missing sem_open, ...);
+            # fall back to rendering every job serially in spec order.
+            pass
+    if timings is None:
+        timings = [_render_asset(job) for job in jobs]
+
+    tracer = tracing.active()
+    if tracer:
+        for name, started, duration, pid in timings:
+            tracer.add_span(f"asset:{name}", started, duration, pid=pid, depth=1)
 
 
 def base_canvas(width=1280, height=720, color="#f5e6d3"):
+    from PIL import Image
+
     return Image.new("RGB", (width, height), color)
 
 
 def load_font(size: int):
-    try:
-        return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
-    except OSError:
-        return ImageFont.load_default()
+    return FONTS.get(size)
 
 
-def create_cafe_background(path: Path):
-    if path.exists():
-        return
-    img = base_canvas(color="#d7b790")
+def create_cafe_background(path: Path, title: str = "Smart Café", color: str = "#d7b790"):
+    from PIL import ImageDraw
+
+    img = base_canvas(color=color)
     draw = ImageDraw.Draw(img)
     cup_color = "#704214"
     saucer_color = "#f5eadf"
@@ -54,48 +155,54 @@ def create_cafe_background(path: Path):
             width=6,
         )
     font = load_font(90)
-    draw.text((60, 60), "Smart Café", fill="#3b2512", font=font)
+    draw.text((60, 60), title, fill="#3b2512", font=font)
     img.save(path, quality=95)
 
 
-def create_college_logo(path: Path):
-    if path.exists():
-        return
+def create_college_logo(path: Path, initials: str = "SC", color: str = "#004d99", accent: str = "#ffb400"):
+    from PIL import Image, ImageDraw
+
     img = Image.new("RGBA", (512, 512), (255, 255, 255, 0))
     draw = ImageDraw.Draw(img)
-    draw.ellipse([16, 16, 496, 496], fill="#004d99")
+    draw.ellipse([16, 16, 496, 496], fill=color)
     draw.ellipse([96, 96, 416, 416], fill="#ffffff")
-    draw.polygon([(256, 120), (360, 392), (152, 392)], fill="#ffb400")
-    draw.text((205, 220), "SC", fill="#004d99", font=load_font(64))
+    draw.polygon([(256, 120), (360, 392), (152, 392)], fill=accent)
+    draw.text((205, 220), initials, fill=color, font=load_font(64))
     img.save(path)
 
 
-def create_industry_graphic(path: Path):
-    if path.exists():
-        return
+def create_industry_graphic(
+    path: Path,
+    title: str = "Café Industry Growth",
+    badge: str = "₹9B",
+    bars: tuple[int, ...] = (220, 340, 480, 620, 700),
+):
+    from PIL import ImageDraw
+
     img = base_canvas(color="#fdf8f3")
     draw = ImageDraw.Draw(img)
-    bars = [220, 340, 480, 620, 700]
     for idx, height in enumerate(bars):
         x0 = 140 + idx * 160
         draw.rectangle([x0, img.height - height, x0 + 100, img.height - 120], fill="#b26b2a")
     draw.line([120, img.height - 120, 1100, img.height - 120], fill="#573116", width=6)
     draw.ellipse([950, 80, 1080, 210], fill="#f2c94c")
-    draw.text((980, 120), "₹9B", fill="#573116", font=load_font(48))
-    draw.text((120, 60), "Café Industry Growth", fill="#573116", font=load_font(64))
+    draw.text((980, 120), badge, fill="#573116", font=load_font(48))
+    draw.text((120, 60), title, fill="#573116", font=load_font(64))
     img.save(path, quality=95)
 
 
-def create_comparison_chart(path: Path):
-    if path.exists():
-        return
+def create_comparison_chart(
+    path: Path,
+    columns: tuple[str, ...] = ("Features", "Cost", "Localization"),
+    rows: tuple[str, ...] = ("Legacy POS", "Premium Suites", "Smart Café"),
+):
+    from PIL import ImageDraw
+
     img = base_canvas(color="#fff9f1")
     draw = ImageDraw.Draw(img)
-    columns = ["Features", "Cost", "Localization"]
     for idx, title in enumerate(columns):
         draw.rectangle([60 + idx * 380, 80, 400 + idx * 380, 140], fill="#704214")
         draw.text((80 + idx * 380, 92), title, fill="#ffffff", font=load_font(32))
-    rows = ["Legacy POS", "Premium Suites", "Smart Café"]
     for ridx, row in enumerate(rows):
         draw.rectangle([60, 160 + ridx * 160, 1180, 300 + ridx * 160], outline="#704214", width=4)
         draw.text((80, 200 + ridx * 160), row, fill="#3b2512", font=load_font(36))
@@ -106,9 +213,9 @@ def create_comparison_chart(path: Path):
     img.save(path, quality=95)
 
 
-def create_busy_cafe_visual(path: Path):
-    if path.exists():
-        return
+def create_busy_cafe_visual(path: Path, caption: str = "Inefficient coordination & missing records"):
+    from PIL import ImageDraw
+
     img = base_canvas(color="#fbeee2")
     draw = ImageDraw.Draw(img)
     draw.rectangle([80, 200, 1200, 520], fill="#d7b58c")
@@ -121,13 +228,13 @@ def create_busy_cafe_visual(path: Path):
     draw.text((930, 120), "Order Queue", fill="#ffffff", font=load_font(40))
     draw.rounded_rectangle([80, 80, 360, 200], radius=40, fill="#3e2723")
     draw.text((120, 120), "Kitchen", fill="#ffffff", font=load_font(40))
-    draw.text((120, 580), "Inefficient coordination & missing records", fill="#3b2512", font=load_font(36))
+    draw.text((120, 580), caption, fill="#3b2512", font=load_font(36))
     img.save(path, quality=95)
 
 
-def create_objective_icon(path: Path):
-    if path.exists():
-        return
+def create_objective_icon(path: Path, caption: str = "Automation Goals"):
+    from PIL import ImageDraw
+
     img = base_canvas(color="#fef6eb")
     draw = ImageDraw.Draw(img)
     draw.ellipse([120, 120, 520, 520], fill="#ffe0b2", outline="#ff9800", width=10)
@@ -138,24 +245,79 @@ def create_objective_icon(path: Path):
     draw.line([320, 460, 520, 460], fill="#ff9800", width=12)
     draw.line([360, 250, 460, 330], fill="#ff9800", width=12)
     draw.line([460, 330, 520, 260], fill="#2e7d32", width=12)
-    draw.text((200, 560), "Automation Goals", fill="#bf360c", font=load_font(40))
+    draw.text((200, 560), caption, fill="#bf360c", font=load_font(40))
     img.save(path, quality=95)
 
 
-def add_title_slide(prs: Presentation):
+# Output filename -> (generator, keyword parameters). Parameters feed the cache
+# key, so edit them here rather than inside the generator bodies.
+ASSET_SPECS = {
+    "cafe_background.jpg": (create_cafe_background, {}),
+    "college_logo.png": (create_college_logo, {}),
+    "industry_graphic.png": (create_industry_graphic, {}),
+    "comparison_chart.png": (create_comparison_chart, {}),
+    "busy_cafe.png": (create_busy_cafe_visual, {}),
+    "objectives.png": (create_objective_icon, {}),
+}
+
+_asset_blobs: dict[str, bytes] = {}
+
+
+def asset_bytes(filename: str) -> bytes:
+    """Render a generated asset straight to encoded bytes, once per process, without touching disk."""
+    if filename not in _asset_blobs:
+        generator, params = ASSET_SPECS[filename]
+        buffer = io.BytesIO()
+        # Pillow picks the encoder from the file object's name, as it would from a path.
+        buffer.name = filename
+        generator(buffer, **params)
+        _asset_blobs[filename] = buffer.getvalue()
+    return _asset_blobs[filename]
+
+
+def add_fitted_picture(slide, image: Path | bytes, left, top, width=None, height=None, dpi: int | None = IMAGE_DPI):
+    # Alt text names the source image, not the resized variant or an anonymous buffer.
+    name = Path(image).name if not isinstance(image, bytes) else getattr(image, "name", None)
+    if isinstance(image, bytes):
+        if dpi:
+            image = fit_image_bytes(image, width, height, dpi)
+        picture = slide.shapes.add_picture(io.BytesIO(image), left, top, width=width, height=height)
+    else:
+        if dpi:
+            image = fit_image(image, width, height, dpi, cache_dir=CACHE_DIR / "variants")
+        picture = slide.shapes.add_picture(str(image), left, top, width=width, height=height)
+    if name:
+        picture._element.nvPicPr.cNvPr.set("descr", name)
+    return picture
+
+
+def add_title_slide(
+    prs: Presentation,
+    title: str = "Smart Cafe Management System",
+    subtitle: str = "B.Tech Mini Project",
+    presenter: str = "Presenter: Aryan Sharma (Roll No. BT21CS045)\nDepartment of Computer Science & Engineering",
+    background: Path | bytes = ASSETS_DIR / "cafe_background.jpg",
+    logo: Path | bytes = ASSETS_DIR / "college_logo.png",
+    image_dpi: int | None = IMAGE_DPI,
+):
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank layout
-    slide.shapes.add_picture(
-        str(ASSETS_DIR / "cafe_background.jpg"),
+    add_fitted_picture(
+        slide,
+        background,
         Inches(0),
         Inches(0),
         width=prs.slide_width,
         height=prs.slide_height,
+        dpi=image_dpi,
     )
 
     title_box = slide.shapes.add_textbox(Inches(0.8), Inches(1.4), Inches(8.5), Inches(2.2))
     title_tf = title_box.text_frame
     title_tf.word_wrap = True
-    title_tf.text = "Smart Cafe Management System"
+    title_tf.text = title
     title_para = title_tf.paragraphs[0]
     title_para.font.size = Pt(54)
     title_para.font.bold = True
@@ -163,23 +325,32 @@ def add_title_slide(prs: Presentation):
 
     subtitle_box = slide.shapes.add_textbox(Inches(0.8), Inches(3), Inches(6.5), Inches(1.2))
     subtitle_tf = subtitle_box.text_frame
-    subtitle_tf.text = "B.Tech Mini Project"
+    subtitle_tf.text = subtitle
     subtitle_para = subtitle_tf.paragraphs[0]
     subtitle_para.font.size = Pt(32)
     subtitle_para.font.color.rgb = RGBColor(255, 255, 255)
 
     presenter_box = slide.shapes.add_textbox(Inches(0.8), Inches(4), Inches(6.5), Inches(1.5))
     presenter_tf = presenter_box.text_frame
-    presenter_tf.text = "Presenter: Aryan Sharma (Roll No. BT21CS045)\nDepartment of Computer Science & Engineering"
+    presenter_tf.text = presenter
     for paragraph in presenter_tf.paragraphs:
         paragraph.font.size = Pt(22)
         paragraph.font.color.rgb = RGBColor(255, 255, 255)
 
-    logo_path = ASSETS_DIR / "college_logo.png"
-    slide.shapes.add_picture(str(logo_path), Inches(9.5), Inches(0.6), height=Inches(1.6))
+    add_fitted_picture(slide, logo, Inches(9.5), Inches(0.6), height=Inches(1.6), dpi=image_dpi)
+    return slide
+
 
+def add_bullet_slide(
+    prs: Presentation,
+    title: str,
+    bullets: list[str],
+    image_path: Path | bytes | None = None,
+    image_dpi: int | None = IMAGE_DPI,
+    chart: dict | None = None,
+):
+    from pptx.util import Inches, Pt
 
-def add_bullet_slide(prs: Presentation, title: str, bullets: list[str], image_path: Path | None = None):
     slide = prs.slides.add_slide(prs.slide_layouts[5])  # title only
     title_placeholder = slide.shapes.title
     title_placeholder.text = title
@@ -198,13 +369,18 @@ def add_bullet_slide(prs: Presentation, title: str, bullets: list[str], image_pa
         para.level = 0
         para.font.size = Pt(24)
 
-    if image_path:
-        slide.shapes.add_picture(str(image_path), Inches(7.5), Inches(2), width=Inches(3.8))
+    if chart:
+        add_chart(slide, chart, Inches(7.5), Inches(2), Inches(3.8), Inches(2.4))
+    elif image_path:
+        add_fitted_picture(slide, image_path, Inches(7.5), Inches(2), width=Inches(3.8), dpi=image_dpi)
 
     return slide
 
 
 def add_section_slide(prs: Presentation, title: str, subtitle: str):
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Pt
+
     slide = prs.slides.add_slide(prs.slide_layouts[0])
     slide.shapes.title.text = title
     slide.shapes.title.text_frame.paragraphs[0].font.size = Pt(42)
@@ -213,260 +389,661 @@ def add_section_slide(prs: Presentation, title: str, subtitle: str):
     slide.placeholders[1].text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
 
 
-def build_presentation():
-    ensure_assets()
-    prs = Presentation()
+INDUSTRY_GROWTH_CHART = {
+    "type": "bar",
+    "title": "Café Industry Growth",
+    "categories": ["Y1", "Y2", "Y3", "Y4", "Y5"],
+    "series": {"Growth index": [220, 340, 480, 620, 700]},
+}
 
-    add_title_slide(prs)
+COMPARISON_TABLE = {
+    "type": "table",
+    "columns": ["Features", "Cost", "Localization"],
+    "rows": [
+        ["Legacy POS", "High Capex", ""],
+        ["Premium Suites", "", "Limited Support"],
+        ["Smart Café", "Affordable, Pay-as-you-go", "Regional Languages"],
+    ],
+}
 
-    slides_data = [
-        (
-            "Motivation & Background",
-            [
-                "Digitize daily café operations to reduce manual overhead and billing errors.",
-                "Empower small Indian cafés with technology tailored to their budgets and workflows.",
-                "Ride the wave of digital payments, UPI adoption, and on-demand ordering trends.",
-            ],
-            ASSETS_DIR / "industry_graphic.png",
-        ),
-        (
-            "Literature Review / Existing Systems",
-            [
-                "Evaluated POS offerings such as Toast, Square, and legacy desktop billing suites.",
-                "Identified pain points: high licensing fees, hardware lock-ins, complicated training.",
-                "Opportunity for a light-weight, browser-based system with local language support.",
-            ],
-            ASSETS_DIR / "comparison_chart.png",
-        ),
-        (
-            "Problem Statement",
-            [
-                "Manual billing produces pricing errors and inconsistent receipts.",
-                "Kitchen receives delayed or unclear order tickets, causing slow service.",
-                "No central view of inventory consumption or wastage trends.",
-                "Customer preferences and loyalty data rarely captured or analyzed.",
-            ],
-            ASSETS_DIR / "busy_cafe.png",
-        ),
-        (
-            "Objectives",
-            [
-                "Automate order capture, billing, and payment reconciliation in real time.",
-                "Provide live inventory tracking with automated low-stock alerts.",
-                "Enable cashier–kitchen coordination via synchronized order screens.",
-                "Build customer engagement with digital receipts and loyalty tracking.",
-            ],
-            ASSETS_DIR / "objectives.png",
-        ),
-        (
-            "Project Scope",
-            [
-                "Develop a responsive web POS optimized for tablets and kiosks.",
-                "Implement admin dashboard for menu, pricing, and staff management.",
-                "Integrate analytics for daily sales, category performance, and peak hours.",
-                "Offer configurable GST rates, combo deals, and discount workflows.",
-            ],
-            None,
-        ),
-        (
-            "System Architecture",
-            [
-                "Three-tier architecture: React front-end, Node.js API layer, PostgreSQL datastore.",
-                "RESTful endpoints secured via JWT, rate-limits, and role-based access control.",
-                "Real-time order updates delivered using WebSockets for kitchen display.",
-                "Deployment via containerized services with auto-scaling on demand.",
-            ],
-            None,
-        ),
-        (
-            "Use Case Overview",
-            [
-                "Cashier: creates orders, accepts payments, prints/whatsapps receipts.",
-                "Chef: views live order queue, updates preparation status.",
-                "Manager: monitors sales KPIs, adjusts inventory, schedules staff.",
-                "Customer: receives digital receipt and loyalty points snapshot.",
-            ],
-            None,
-        ),
-        (
-            "Point-of-Sale Module",
-            [
-                "Touch-friendly menu segmented by beverages, snacks, combos, custom add-ons.",
-                "Quick cart modifications, split bills, and multi-payment mode support (UPI/cash/cards).",
-                "Automatic GST breakdown and ledger-friendly receipt exports.",
-                "Offline caching using service workers for uninterrupted billing.",
-            ],
-            None,
-        ),
-        (
-            "Inventory & Procurement Module",
-            [
-                "Maps recipes to raw material consumption for precise stock deductions.",
-                "Batch-wise inventory with expiry tracking to reduce wastage.",
-                "Supplier management for purchase orders and delivery timelines.",
-                "Predictive reorder suggestions based on historical sales velocity.",
-            ],
-            None,
-        ),
-        (
-            "Customer Engagement Module",
-            [
-                "Digital wallet and loyalty point accrual linked to phone numbers.",
-                "Targeted offers via SMS/WhatsApp templates with click-through tracking.",
-                "Feedback capture post-order with sentiment summarization.",
-                "Heatmaps of repeat visits to drive personalized campaigns.",
-            ],
-            None,
-        ),
-        (
-            "Technology Stack",
-            [
-                "Front-end: Next.js + TypeScript with Tailwind CSS for rapid UI composition.",
-                "Back-end: Node.js (NestJS) microservices orchestrated via Express gateway.",
-                "Database: Supabase/PostgreSQL with row-level security & backups.",
-                "Integrations: Razorpay/UPI, Firebase Cloud Messaging, webhooks for accounting.",
-            ],
-            None,
-        ),
-        (
-            "Database Design Highlights",
-            [
-                "Tables for menu_items, orders, order_items, payments, stocks, suppliers, customers.",
-                "Use of database triggers to maintain inventory ledger and audit trails.",
-                "JSONB columns to store dynamic modifiers and localized descriptions.",
-                "Materialized views power dashboard KPIs and peak hour analytics.",
-            ],
-            None,
-        ),
-        (
-            "Key User Interfaces",
-            [
-                "Dashboard shows today's revenue, average ticket size, best-selling items.",
-                "Kitchen Display Screen (KDS) grouping orders by status and time elapsed.",
-                "Inventory board with traffic-light indicators for stock health.",
-                "Customer profile view aggregating feedback, spend, and favorites.",
-            ],
-            None,
-        ),
-        (
-            "Order Workflow",
-            [
-                "Order initiated at POS, items selected, modifiers applied.",
-                "Payment processed with automatic receipt generation and loyalty update.",
-                "Order pushed to KDS; chef marks stages (accepted, preparing, ready).",
-                "Completion triggers inventory deduction and analytics logging.",
-            ],
-            None,
-        ),
-        (
-            "Implementation Plan",
-            [
-                "Phase 1 (Weeks 1-3): Requirements finalization, UI wireframes, database schema.",
-                "Phase 2 (Weeks 4-7): Core POS build, order APIs, authentication modules.",
-                "Phase 3 (Weeks 8-10): Inventory automation, reporting dashboards, KDS.",
-                "Phase 4 (Weeks 11-12): Testing cycles, deployment, stakeholder training.",
-            ],
-            None,
-        ),
-        (
-            "Core Algorithms & Logic",
-            [
-                "Bill computation engine handles tax slabs, discounts, rounding, and tender types.",
-                "Inventory scheduler reconciles real-time sales with batch-level stock.",
-                "Recommendation engine suggests combos via association rule mining.",
-                "Alerting subsystem generates notifications for KPIs exceeding thresholds.",
-            ],
-            None,
-        ),
-        (
-            "Security & Compliance",
-            [
-                "Role-based access control separating cashier, chef, manager permissions.",
-                "End-to-end TLS, hashed credentials with bcrypt, and optional OTP login.",
-                "Audit logs capture critical actions: voided bills, refunds, price changes.",
-                "Compliant with GST invoicing rules and data residency guidelines in India.",
-            ],
-            None,
-        ),
-        (
-            "Testing Strategy",
-            [
-                "Unit tests for billing calculations, inventory adjustments, and API endpoints.",
-                "Integration tests simulating POS-KDS interactions under peak load.",
-                "User acceptance testing with café staff to validate usability and workflows.",
-                "Performance benchmarking ensuring sub-2 second response for 95th percentile.",
-            ],
-            None,
-        ),
-        (
-            "Results & Insights",
-            [
-                "Pilot café reduced billing time per order by 35% after adoption.",
-                "Inventory variance dropped from 11% to 3% through automated deductions.",
-                "Daily dashboard enabled faster menu adjustments and improved margins.",
-                "Positive feedback on bilingual UI and WhatsApp receipt sharing.",
-            ],
-            None,
-        ),
-        (
-            "Cost & Feasibility Analysis",
-            [
-                "Development cost estimated at ₹1.8L with in-house team and open-source stack.",
-                "Operational costs under ₹4k/month covering hosting, SMS, and maintenance.",
-                "Break-even within 9 months for cafés averaging 150 orders/day.",
-                "Scalable pricing tiers for single-outlet and franchise models.",
-            ],
-            None,
-        ),
-        (
-            "Challenges & Mitigation",
-            [
-                "Unstable connectivity: implemented offline-first caching and sync queues.",
-                "Staff adoption: provided vernacular tutorials and role-based onboarding.",
-                "Data accuracy: enforced validation rules and reconciliation dashboards.",
-                "Feature creep: maintained backlog with MoSCoW prioritization.",
-            ],
-            None,
-        ),
-        (
-            "Future Enhancements",
-            [
-                "AI-driven demand forecasting and automated procurement suggestions.",
-                "IoT integration for smart coffee machines and energy monitoring.",
-                "Dynamic pricing experiments based on footfall and weather data.",
-                "Marketplace tie-ins with delivery aggregators for omnichannel ordering.",
-            ],
-            None,
-        ),
-        (
-            "Conclusion",
-            [
-                "Smart Cafe Management System modernizes café operations end-to-end.",
-                "Provides affordable digital transformation tailored to Indian SMBs.",
-                "Delivers actionable insights for profitability and customer loyalty growth.",
-                "Ready roadmap for scaling into a multi-outlet SaaS platform.",
-            ],
-            None,
-        ),
-        (
-            "References & Acknowledgements",
-            [
-                "Industry reports from NRAI India Food Services and FICCI hospitality outlook.",
-                "Product benchmarks from Toast POS, Petpooja, and Loyverse documentation.",
-                "Mentor guidance from Prof. Kavita Desai and Café Ananda pilot partner.",
-                "Open-source communities for Next.js, Supabase, and analytics tooling.",
-            ],
-            None,
-        ),
-    ]
+SLIDES_DATA = [
+    (
+        "Motivation & Background",
+        [
+            "Digitize daily café operations to reduce manual overhead and billing errors.",
+            "Empower small Indian cafés with technology tailored to their budgets and workflows.",
+            "Ride the wave of digital payments, UPI adoption, and on-demand ordering trends.",
+        ],
+        ASSETS_DIR / "industry_graphic.png",
+        INDUSTRY_GROWTH_CHART,
+    ),
+    (
+        "Literature Review / Existing Systems",
+        [
+            "Evaluated POS offerings such as Toast, Square, and legacy desktop billing suites.",
+            "Identified pain points: high licensing fees, hardware lock-ins, complicated training.",
+            "Opportunity for a light-weight, browser-based system with local language support.",
+        ],
+        ASSETS_DIR / "comparison_chart.png",
+        COMPARISON_TABLE,
+    ),
+    (
+        "Problem Statement",
+        [
+            "Manual billing produces pricing errors and inconsistent receipts.",
+            "Kitchen receives delayed or unclear order tickets, causing slow service.",
+            "No central view of inventory consumption or wastage trends.",
+            "Customer preferences and loyalty data rarely captured or analyzed.",
+        ],
+        ASSETS_DIR / "busy_cafe.png",
+    ),
+    (
+        "Objectives",
+        [
+            "Automate order capture, billing, and payment reconciliation in real time.",
+            "Provide live inventory tracking with automated low-stock alerts.",
+            "Enable cashier–kitchen coordination via synchronized order screens.",
+            "Build customer engagement with digital receipts and loyalty tracking.",
+        ],
+        ASSETS_DIR / "objectives.png",
+    ),
+    (
+        "Project Scope",
+        [
+            "Develop a responsive web POS optimized for tablets and kiosks.",
+            "Implement admin dashboard for menu, pricing, and staff management.",
+            "Integrate analytics for daily sales, category performance, and peak hours.",
+            "Offer configurable GST rates, combo deals, and discount workflows.",
+        ],
+        None,
+    ),
+    (
+        "System Architecture",
+        [
+            "Three-tier architecture: React front-end, Node.js API layer, PostgreSQL datastore.",
+            "RESTful endpoints secured via JWT, rate-limits, and role-based access control.",
+            "Real-time order updates delivered using WebSockets for kitchen display.",
+            "Deployment via containerized services with auto-scaling on demand.",
+        ],
+        None,
+    ),
+    (
+        "Use Case Overview",
+        [
+            "Cashier: creates orders, accepts payments, prints/whatsapps receipts.",
+            "Chef: views live order queue, updates preparation status.",
+            "Manager: monitors sales KPIs, adjusts inventory, schedules staff.",
+            "Customer: receives digital receipt and loyalty points snapshot.",
+        ],
+        None,
+    ),
+    (
+        "Point-of-Sale Module",
+        [
+            "Touch-friendly menu segmented by beverages, snacks, combos, custom add-ons.",
+            "Quick cart modifications, split bills, and multi-payment mode support (UPI/cash/cards).",
+            "Automatic GST breakdown and ledger-friendly receipt exports.",
+            "Offline caching using service workers for uninterrupted billing.",
+        ],
+        None,
+    ),
+    (
+        "Inventory & Procurement Module",
+        [
+            "Maps recipes to raw material consumption for precise stock deductions.",
+            "Batch-wise inventory with expiry tracking to reduce wastage.",
+            "Supplier management for purchase orders and delivery timelines.",
+            "Predictive reorder suggestions based on historical sales velocity.",
+        ],
+        None,
+    ),
+    (
+        "Customer Engagement Module",
+        [
+            "Digital wallet and loyalty point accrual linked to phone numbers.",
+            "Targeted offers via SMS/WhatsApp templates with click-through tracking.",
+            "Feedback capture post-order with sentiment summarization.",
+            "Heatmaps of repeat visits to drive personalized campaigns.",
+        ],
+        None,
+    ),
+    (
+        "Technology Stack",
+        [
+            "Front-end: Next.js + TypeScript with Tailwind CSS for rapid UI composition.",
+            "Back-end: Node.js (NestJS) microservices orchestrated via Express gateway.",
+            "Database: Supabase/PostgreSQL with row-level security & backups.",
+            "Integrations: Razorpay/UPI, Firebase Cloud Messaging, webhooks for accounting.",
+        ],
+        None,
+    ),
+    (
+        "Database Design Highlights",
+        [
+            "Tables for menu_items, orders, order_items, payments, stocks, suppliers, customers.",
+            "Use of database triggers to maintain inventory ledger and audit trails.",
+            "JSONB columns to store dynamic modifiers and localized descriptions.",
+            "Materialized views power dashboard KPIs and peak hour analytics.",
+        ],
+        None,
+    ),
+    (
+        "Key User Interfaces",
+        [
+            "Dashboard shows today's revenue, average ticket size, best-selling items.",
+            "Kitchen Display Screen (KDS) grouping orders by status and time elapsed.",
+            "Inventory board with traffic-light indicators for stock health.",
+            "Customer profile view aggregating feedback, spend, and favorites.",
+        ],
+        None,
+    ),
+    (
+        "Order Workflow",
+        [
+            "Order initiated at POS, items selected, modifiers applied.",
+            "Payment processed with automatic receipt generation and loyalty update.",
+            "Order pushed to KDS; chef marks stages (accepted, preparing, ready).",
+            "Completion triggers inventory deduction and analytics logging.",
+        ],
+        None,
+    ),
+    (
+        "Implementation Plan",
+        [
+            "Phase 1 (Weeks 1-3): Requirements finalization, UI wireframes, database schema.",
+            "Phase 2 (Weeks 4-7): Core POS build, order APIs, authentication modules.",
+            "Phase 3 (Weeks 8-10): Inventory automation, reporting dashboards, KDS.",
+            "Phase 4 (Weeks 11-12): Testing cycles, deployment, stakeholder training.",
+        ],
+        None,
+    ),
+    (
+        "Core Algorithms & Logic",
+        [
+            "Bill computation engine handles tax slabs, discounts, rounding, and tender types.",
+            "Inventory scheduler reconciles real-time sales with batch-level stock.",
+            "Recommendation engine suggests combos via association rule mining.",
+            "Alerting subsystem generates notifications for KPIs exceeding thresholds.",
+        ],
+        None,
+    ),
+    (
+        "Security & Compliance",
+        [
+            "Role-based access control separating cashier, chef, manager permissions.",
+            "End-to-end TLS, hashed credentials with bcrypt, and optional OTP login.",
+            "Audit logs capture critical actions: voided bills, refunds, price changes.",
+            "Compliant with GST invoicing rules and data residency guidelines in India.",
+        ],
+        None,
+    ),
+    (
+        "Testing Strategy",
+        [
+            "Unit tests for billing calculations, inventory adjustments, and API endpoints.",
+            "Integration tests simulating POS-KDS interactions under peak load.",
+            "User acceptance testing with café staff to validate usability and workflows.",
+            "Performance benchmarking ensuring sub-2 second response for 95th percentile.",
+        ],
+        None,
+    ),
+    (
+        "Results & Insights",
+        [
+            "Pilot café reduced billing time per order by 35% after adoption.",
+            "Inventory variance dropped from 11% to 3% through automated deductions.",
+            "Daily dashboard enabled faster menu adjustments and improved margins.",
+            "Positive feedback on bilingual UI and WhatsApp receipt sharing.",
+        ],
+        None,
+    ),
+    (
+        "Cost & Feasibility Analysis",
+        [
+            "Development cost estimated at ₹1.8L with in-house team and open-source stack.",
+            "Operational costs under ₹4k/month covering hosting, SMS, and maintenance.",
+            "Break-even within 9 months for cafés averaging 150 orders/day.",
+            "Scalable pricing tiers for single-outlet and franchise models.",
+        ],
+        None,
+    ),
+    (
+        "Challenges & Mitigation",
+        [
+            "Unstable connectivity: implemented offline-first caching and sync queues.",
+            "Staff adoption: provided vernacular tutorials and role-based onboarding.",
+            "Data accuracy: enforced validation rules and reconciliation dashboards.",
+            "Feature creep: maintained backlog with MoSCoW prioritization.",
+        ],
+        None,
+    ),
+    (
+        "Future Enhancements",
+        [
+            "AI-driven demand forecasting and automated procurement suggestions.",
+            "IoT integration for smart coffee machines and energy monitoring.",
+            "Dynamic pricing experiments based on footfall and weather data.",
+            "Marketplace tie-ins with delivery aggregators for omnichannel ordering.",
+        ],
+        None,
+    ),
+    (
+        "Conclusion",
+        [
+            "Smart Cafe Management System modernizes café operations end-to-end.",
+            "Provides affordable digital transformation tailored to Indian SMBs.",
+            "Delivers actionable insights for profitability and customer loyalty growth.",
+            "Ready roadmap for scaling into a multi-outlet SaaS platform.",
+        ],
+        None,
+    ),
+    (
+        "References & Acknowledgements",
+        [
+            "Industry reports from NRAI India Food Services and FICCI hospitality outlook.",
+            "Product benchmarks from Toast POS, Petpooja, and Loyverse documentation.",
+            "Mentor guidance from Prof. Kavita Desai and Café Ananda pilot partner.",
+            "Open-source communities for Next.js, Supabase, and analytics tooling.",
+        ],
+        None,
+    ),
+]
+
+
+DEFAULT_DECK = {
+    "name": "Smart Cafe Management System",
+    "output": "Smart Cafe Management System.pptx",
+    "slides": SLIDES_DATA,
+}
+
+
+def generated_asset(image) -> str | None:
+    """The ``ASSET_SPECS`` name ``image`` refers to: a bare asset file name or one under ``ASSETS_DIR``."""
+    path = Path(image)
+    if path.name not in ASSET_SPECS:
+        return None
+    if path.parent == Path(".") or path.parent == ASSETS_DIR or path.parent.resolve() == ASSETS_DIR.resolve():
+        return path.name
+    # Same file name in any other directory is the user's own picture.
+    return None
+
+
+def resolve_image(image: str | None, assets_dir: Path | None = ASSETS_DIR) -> Path | bytes | None:
+    """Map a slide's image to a file, or to encoded bytes when ``assets_dir`` is None (in-memory builds)."""
+    if not image:
+        return None
+    path = Path(image)
+    generated = generated_asset(path) is not None
+    if assets_dir is None:
+        return ImageBlob(asset_bytes(path.name) if generated else path.read_bytes(), path.name)
+    if generated:
+        # Generated assets are referenced by file name and live wherever ensure_assets() put them.
+        return assets_dir / path.name
+    return path
+
+
+def spec_images(spec: dict, chart_mode: str = CHART_MODE) -> list[str]:
+    """Image references a spec actually embeds; slides drawn as native charts need none."""
+    images = [spec.get("background", "cafe_background.jpg"), spec.get("logo", "college_logo.png")]
+    for slide in spec["slides"]:
+        if slide["image"] and not (chart_mode == "native" and slide.get("chart")):
+            images.append(slide["image"])
+    return images
+
+
+def required_assets(spec: dict, chart_mode: str = CHART_MODE) -> set[str]:
+    return {generated_asset(image) for image in spec_images(spec, chart_mode)} - {None}
+
+
+# Modules whose code shapes the saved bytes; their source is part of deck_hash().
+BUILD_MODULES = (
+    "generate_presentation",
+    "charts",
+    "deck_spec",
+    "fonts",
+    "images",
+    "overflow",
+    "reproducible",
+    "streaming",
+    "templates",
+)
+BUILD_PACKAGES = ("python-pptx", "Pillow", "XlsxWriter", "lxml")
+
+
+def code_fingerprint() -> dict:
+    """Hashes of the build modules and versions of the encoding packages; any change alters the output."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    packages = {}
+    for package in BUILD_PACKAGES:
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+    return {
+        "code": {name: file_hash(Path(importlib.import_module(name).__file__)) for name in BUILD_MODULES},
+        "packages": packages,
+    }
+
+
+def deck_hash(
+    spec: dict | None = None,
+    template: Path | None = None,
+    image_dpi: int | None = IMAGE_DPI,
+    chart_mode: str = CHART_MODE,
+    stream: bool = False,
+    overflow: str | None = None,
+    slides: Iterable | None = None,
+) -> str:
+    """Hash every input of a reproducible build, so callers can skip decks they already have.
+
+    Generated assets count by generator source and parameters, other images by
+    content, alongside the template, the drawing font, the build code and the
+    versions of the packages that encode the output. With ``overflow`` the mode
+    and the fonts whose metrics drive it count too, since ``shrink`` rewrites
+    font sizes. ``slides`` replaces the spec's slides as in
+    :func:`build_presentation`.
+    """
+    import hashlib
+    import json
+
+    spec = normalize_spec(spec or DEFAULT_DECK)
+    if template:
+        spec["template"] = str(template)
+    if slides is not None:
+        spec["slides"] = [normalize_slide(slide) for slide in slides]
+    chart_mode = resolve_chart_mode(chart_mode)
+    images = {}
+    for image in spec_images(spec, chart_mode):
+        name = generated_asset(image)
+        if name:
+            generator, params = ASSET_SPECS[name]
+            images[str(image)] = generator_key(generator, params, ASSET_CODE_VERSION)
+        else:
+            images[str(image)] = file_hash(Path(image))
+    font = FONTS.resolve()
+    metric_fonts = {}
+    if overflow:
+        for family in {text_family(False), text_family(True)}:
+            path = FONTS.resolve(family)
+            metric_fonts[family] = file_hash(Path(path)) if path else None
+    payload = {
+        # The deck name and output path do not end up in the package.
+        "spec": {key: value for key, value in spec.items() if key not in ("name", "output")},
+        "template": template_fingerprint(spec.get("template")),
+        "images": images,
+        "font": file_hash(Path(font)) if font else None,
+        **code_fingerprint(),
+        "image_dpi": image_dpi,
+        "chart_mode": chart_mode,
+        "stream": stream,
+        "overflow": overflow,
+        "metric_fonts": metric_fonts,
+        "date_time": build_date_time(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def slide_jobs(
+    spec: dict,
+    assets_dir: Path | None = ASSETS_DIR,
+    image_dpi: int | None = IMAGE_DPI,
+    chart_mode: str = CHART_MODE,
+) -> list[tuple]:
+    """Expand a spec into ``(builder, kwargs)`` calls, one per slide, title slide first."""
+    return list(iter_slide_jobs(spec, spec["slides"], assets_dir, image_dpi, chart_mode))
+
+
+def iter_slide_jobs(
+    spec: dict,
+    slides: Iterable,
+    assets_dir: Path | None = ASSETS_DIR,
+    image_dpi: int | None = IMAGE_DPI,
+    chart_mode: str = CHART_MODE,
+) -> Iterator[tuple]:
+    """Lazily expand title fields plus any iterable of slide specs into ``(builder, kwargs)`` calls."""
+    title_fields = {field: spec[field] for field in ("title", "subtitle", "presenter") if field in spec}
+    title_fields["background"] = resolve_image(spec.get("background", "cafe_background.jpg"), assets_dir)
+    title_fields["logo"] = resolve_image(spec.get("logo", "college_logo.png"), assets_dir)
+    yield add_title_slide, {**title_fields, "image_dpi": image_dpi}
+    for slide in slides:
+        slide = normalize_slide(slide)
+        chart = slide.get("chart") if chart_mode == "native" else None
+        image = None if chart else resolve_image(slide["image"], assets_dir)
+        if image is None and slide.get("chart") and not chart:
+            # Raster mode with no pre-rendered picture: draw the chart from its own data.
+            image = ImageBlob(render_chart(slide["chart"]), slide["chart"].get("title") or f"{slide['title']} chart")
+        kwargs = {
+            "title": slide["title"],
+            "bullets": slide["bullets"],
+            "image_path": image,
+            "image_dpi": image_dpi,
+            "chart": chart,
+        }
+        yield add_bullet_slide, kwargs
+
+
+def add_job_slide(prs: Presentation, index: int, builder, kwargs: dict, overflow: str | None = None):
+    with tracing.span(builder.__name__, index=index, title=kwargs.get("title")):
+        slide = builder(prs, **kwargs)
+    if overflow:
+        with tracing.span("overflow_check", index=index):
+            check_slide(slide, index, overflow)
+    return slide
+
+
+def build_deck(
+    spec: dict,
+    assets_dir: Path | None = ASSETS_DIR,
+    image_dpi: int | None = IMAGE_DPI,
+    chart_mode: str = CHART_MODE,
+    overflow: str | None = None,
+) -> Presentation:
+    timed_import("pptx")
+    with tracing.span("template"):
+        prs = new_presentation(spec.get("template"))
+    chart_mode = resolve_chart_mode(chart_mode)
+    for index, (builder, kwargs) in enumerate(slide_jobs(spec, assets_dir, image_dpi, chart_mode)):
+        add_job_slide(prs, index, builder, kwargs, overflow)
+    return prs
+
+
+def build_presentation(
+    spec: dict | None = None,
+    output_path: Path | BinaryIO | None = None,
+    asset_workers: int | None = 1,
+    template: Path | None = None,
+    image_dpi: int | None = IMAGE_DPI,
+    trace: bool = False,
+    trace_memory: bool = False,
+    profile: bool = False,
+    timings: bool = False,
+    chart_mode: str = CHART_MODE,
+    incremental: bool = False,
+    stream: bool = False,
+    slides: Iterable | None = None,
+    in_memory: bool = False,
+    variants: Path | None = None,
+    reproducible: bool = False,
+    overflow: str | None = None,
+):
+    """Build one deck and save it to ``output_path``, a path or any writable binary stream.
+
+    ``slides`` replaces the spec's slide list with any iterable. With ``stream``
+    it is consumed lazily and each slide is flushed to the output as soon as it
+    is built, so a generator over thousands of items runs in bounded memory.
+    ``in_memory`` renders assets to bytes and embeds them from buffers, so
+    nothing is written to ``assets/`` or the asset cache. ``variants`` names a
+    directory of ``<locale>.json`` string tables; each one yields a translated
+    ``<deck>.<locale>.pptx`` derived from the single build. ``reproducible``
+    makes identical inputs (see :func:`deck_hash`) give byte-identical files.
+    ``overflow`` (``warn``, ``shrink`` or ``error``) checks every wrapping text
+    box against estimated text height as each slide is built, before saving.
+    """
+    spec = normalize_spec(spec or DEFAULT_DECK)
+    if template:
+        spec["template"] = str(template)
+    if incremental and reproducible:
+        raise ValueError("incremental builds patch the previous output and cannot be reproducible")
+    to_stream = hasattr(output_path, "write")
+    if not to_stream:
+        output_path = Path(output_path or spec["output"])
+    elif incremental or variants:
+        raise ValueError("incremental and variant builds work from the saved deck file and need an output path")
+    # Keep progress messages off stdout when the deck itself may be going there.
+    log = sys.stderr if to_stream else sys.stdout
+    assets_dir = None if in_memory else ASSETS_DIR
+    date_time = build_date_time() if reproducible else None
+    add_slide = functools.partial(add_job_slide, overflow=overflow)
+    chart_mode = resolve_chart_mode(chart_mode)
+    if slides is not None and not stream:
+        spec["slides"] = [normalize_slide(slide) for slide in slides]
+        slides = None
+
+    write_trace = trace or trace_memory or profile
+    tracer = tracing.start(memory=trace_memory, profile=profile) if write_trace or timings else None
+    try:
+        if not in_memory:
+            # Lazily streamed slides cannot be scanned up front, so they get the full asset set.
+            ensure_assets(workers=asset_workers, names=None if slides is not None else required_assets(spec, chart_mode))
+        if stream:
+            timed_import("pptx")
+            slide_source = spec["slides"] if slides is None else slides
+            jobs = iter_slide_jobs(spec, slide_source, assets_dir, image_dpi=image_dpi, chart_mode=chart_mode)
+            stats = stream_deck(jobs, output_path, add_slide, spec.get("template"), date_time)
+            print(f"Streamed {stats['slides']} slides with {stats['media']} shared media parts", file=log)
+        elif incremental:
+            timed_import("pptx")
+            jobs = slide_jobs(spec, assets_dir, image_dpi=image_dpi, chart_mode=chart_mode)
+            options = {"overflow": overflow} if overflow else None
+            stats = build_incremental(jobs, output_path, add_slide, spec.get("template"), options, code_fingerprint())
+            print(f"Reused {stats['reused']}/{stats['slides']} slides, rebuilt {stats['rebuilt']}, removed {stats['removed']}")
+        else:
+            prs = build_deck(spec, assets_dir, image_dpi=image_dpi, chart_mode=chart_mode, overflow=overflow)
+            with tracing.span("save", slides=len(prs.slides)):
+                if reproducible:
+                    save_reproducible(prs, output_path, date_time)
+                else:
+                    prs.save(output_path)
+    finally:
+        if tracer:
+            tracing.stop()
+    if to_stream:
+        output_path.flush()
+        print(f"Wrote presentation to {getattr(output_path, 'name', type(output_path).__name__)}", file=log)
+    else:
+        print(f"Saved presentation to {output_path.resolve()}")
+    if tracer and write_trace:
+        # Trace files for a streamed deck go next to the spec's default output name.
+        for path in tracer.write(Path(spec["output"]) if to_stream else output_path):
+            print(f"Wrote trace to {path}", file=log)
+    if variants:
+        for locale, result in build_variants(output_path, load_string_tables(variants), output_path).items():
+            print(f"Saved {locale} variant to {result['output']} ({result['translated']} translated, {result['missing']} missing)")
+    if timings:
+        print_timings(tracer, file=log)
+    return output_path
+
+
+def print_timings(tracer: tracing.Tracer, file=None):
+    rows = [(f"import {name}", seconds * 1000) for name, seconds in IMPORT_SECONDS.items()]
+    totals = tracer.summary()["totals"]
+    stages = ("ensure_assets", "template", "add_title_slide", "add_bullet_slide", "save")
+    rows += [(name, totals[name]["total_ms"]) for name in stages if name in totals]
+    for label, ms in rows:
+        print(f"  {label:<34} {ms:9.1f} ms", file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Smart Cafe Management System deck.")
+    parser.add_argument(
+        "--asset-workers",
+        type=int,
+        default=1,
+        help="processes used to render missing assets (0 = one per CPU, 1 = serial)",
+    )
+    parser.add_argument("--template", type=Path, help="corporate .pptx/.potx to build on instead of the default")
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        default=IMAGE_DPI,
+        help="downscale pictures to this resolution at their placed size (0 = embed originals)",
+    )
+    parser.add_argument(
+        "--charts",
+        choices=("native", "raster"),
+        default=CHART_MODE,
+        help="draw slide charts as PowerPoint charts/tables or embed the rendered images",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse unchanged slides from the previous build of the output (tracked in <deck>.build.json)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="flush each slide to the output as it is built, keeping memory flat for very large decks",
+    )
+    parser.add_argument("--slides", type=Path, help="JSONL file of slides to use instead of the built-in content")
+    parser.add_argument("--output", help="where to save the deck; - writes the .pptx bytes to stdout")
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="render assets to memory and embed them from buffers instead of assets/ and the on-disk cache",
+    )
+    parser.add_argument("--variants", type=Path, help="directory of <locale>.json string tables to write translated copies from")
+    parser.add_argument(
+        "--check-overflow",
+        choices=OVERFLOW_MODES,
+        help="estimate whether text fits its box: warn, shrink the font to fit, or fail the build",
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="write byte-identical output for identical inputs (fixed timestamps, honours SOURCE_DATE_EPOCH)",
+    )
+    parser.add_argument("--hash", action="store_true", help="print the reproducible build's input hash and exit without building")
+    parser.add_argument("--trace", action="store_true", help="write per-stage timing spans next to the deck")
+    parser.add_argument("--trace-memory", action="store_true", help="also record tracemalloc deltas (implies --trace)")
+    parser.add_argument("--profile", action="store_true", help="also capture a cProfile .prof file (implies --trace)")
+    parser.add_argument("--timings", action="store_true", help="print import and per-stage timings")
+    args = parser.parse_args(argv)
+    if args.hash:
+        print(
+            deck_hash(
+                template=args.template,
+                image_dpi=args.image_dpi,
+                chart_mode=args.charts,
+                stream=args.stream,
+                overflow=args.check_overflow,
+                slides=iter_slides(args.slides) if args.slides else None,
+            )
+        )
+        return
+    output = sys.stdout.buffer if args.output == "-" else args.output
+    build_presentation(
+        output_path=output,
+        asset_workers=args.asset_workers,
+        template=args.template,
+        image_dpi=args.image_dpi,
+        trace=args.trace,
+        trace_memory=args.trace_memory,
+        profile=args.profile,
+        timings=args.timings,
+        chart_mode=args.charts,
+        incremental=args.incremental,
+        stream=args.stream,
+        slides=iter_slides(args.slides) if args.slides else None,
+        in_memory=args.in_memory,
+        variants=args.variants,
+        reproducible=args.reproducible,
+        overflow=args.check_overflow,
+    )
 
-    for title, bullets, image in slides_data:
-        add_bullet_slide(prs, title, bullets, image)
 
-    output_path = Path("Smart Cafe Management System.pptx")
-    prs.save(output_path)
-    print(f"Saved presentation to {output_path.resolve()}")
+IMPORT_SECONDS["generate_presentation"] = time.perf_counter() - _MODULE_STARTED
 
 
 if __name__ == "__main__":
-    build_presentation()
+    main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from asset_cache import touch
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+EMU_PER_INCH = 914400
+DEFAULT_DPI = 150
+# Above this many distinct colours after resizing, an opaque image is treated as a photo.
+FLAT_COLOR_LIMIT = 4096
+JPEG_QUALITY = 85
+# Bump when the resize or encode settings change so cached variants are rebuilt.
+PIPELINE_VERSION = 1
+
+_resolved: dict[tuple, Path] = {}
+_resolved_bytes: dict[tuple, bytes] = {}
+
+
+class ImageBlob(bytes):
+    """Encoded image bytes that remember the file name they stand for, like a named file object."""
+
+    def __new__(cls, data: bytes, name: str):
+        blob = super().__new__(cls, data)
+        blob.name = name
+        return blob
+
+    def __reduce__(self):
+        return type(self), (bytes(self), self.name)
+
+
+def target_size(image_size: tuple[int, int], width: int | None, height: int | None, dpi: int) -> tuple[int, int]:
+    """Pixel size for an image shown at ``width``/``height`` EMU, never larger than the source."""
+    src_w, src_h = image_size
+    if width is None and height is None:
+        return src_w, src_h
+    if width is None:
+        width = height * src_w / src_h
+    if height is None:
+        height = width * src_h / src_w
+    scale = min(width / EMU_PER_INCH * dpi / src_w, height / EMU_PER_INCH * dpi / src_h, 1.0)
+    return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+
+
+def fit_image(path: Path, width: int | None = None, height: int | None = None, dpi: int = DEFAULT_DPI, cache_dir: Path = Path(".asset_cache") / "variants") -> Path:
+    """Return a right-sized, recompressed copy of ``path`` for a picture placed at ``width`` x ``height`` EMU.
+
+    Variants are keyed by the source content hash, so a regenerated asset gets a
+    new variant while an unchanged one is reused across runs. The original is
+    returned when re-encoding would not make it smaller.
+    """
+    path = Path(path)
+    stat = path.stat()
+    memo_key = (str(path), stat.st_mtime_ns, stat.st_size, width, height, dpi)
+    # A variant can be pruned by another process after it was memoized.
+    if memo_key in _resolved and _resolved[memo_key].exists():
+        return _resolved[memo_key]
+
+    from PIL import Image
+
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:24]
+    with Image.open(path) as img:
+        size = target_size(img.size, width, height, dpi)
+        stem = f"{digest}-{size[0]}x{size[1]}-v{PIPELINE_VERSION}"
+        existing = [cache_dir / f"{stem}{suffix}" for suffix in (".jpg", ".png")]
+        variant = next((candidate for candidate in existing if candidate.exists()), None)
+        if variant is None:
+            variant = _encode_variant(img, size, cache_dir, stem)
+        else:
+            touch(variant)
+
+    result = variant if variant.stat().st_size < len(data) else path
+    _resolved[memo_key] = result
+    return result
+
+
+def fit_image_bytes(data: bytes, width: int | None = None, height: int | None = None, dpi: int = DEFAULT_DPI) -> bytes:
+    """In-memory twin of :func:`fit_image` for callers that must not touch disk; memoized per process."""
+    memo_key = (hashlib.sha256(data).hexdigest(), width, height, dpi)
+    if memo_key not in _resolved_bytes:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            encoded, _ = _encode(img, target_size(img.size, width, height, dpi))
+        _resolved_bytes[memo_key] = encoded if len(encoded) < len(data) else data
+    return _resolved_bytes[memo_key]
+
+
+def _encode_variant(img: Image.Image, size: tuple[int, int], cache_dir: Path, stem: str) -> Path:
+    data, suffix = _encode(img, size)
+    variant = cache_dir / f"{stem}{suffix}"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write under a temporary name so concurrent batch workers never embed a half-written file.
+    tmp_path = variant.with_name(f"{variant.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, variant)
+    return variant
+
+
+def _encode(img: Image.Image, size: tuple[int, int]) -> tuple[bytes, str]:
+    from PIL import Image
+
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    resized = img.convert("RGBA" if has_alpha else "RGB")
+    if resized.size != size:
+        resized = resized.resize(size, Image.Resampling.LANCZOS)
+
+    is_photo = not has_alpha and (img.format == "JPEG" or resized.getcolors(FLAT_COLOR_LIMIT) is None)
+    if is_photo:
+        suffix = ".jpg"
+        save_args = {"format": "JPEG", "quality": JPEG_QUALITY, "optimize": True, "progressive": True}
+    else:
+        suffix = ".png"
+        method = Image.Quantize.FASTOCTREE if has_alpha else Image.Quantize.MEDIANCUT
+        resized = resized.quantize(colors=256, method=method)
+        save_args = {"format": "PNG", "optimize": True}
+
+    buffer = io.BytesIO()
+    resized.save(buffer, **save_args)
+    return buffer.getvalue(), suffix
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import tracing
+from asset_cache import generator_key
+from templates import new_presentation, template_bytes
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+
+
+# Bump when the manifest layout or fingerprint recipe changes.
+MANIFEST_VERSION = 1
+
+_file_hashes: dict[tuple, str] = {}
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.name}.build.json")
+
+
+def file_hash(path: Path) -> str:
+    stat = path.stat()
+    memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if memo_key not in _file_hashes:
+        _file_hashes[memo_key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _file_hashes[memo_key]
+
+
+def slide_fingerprint(builder, kwargs: dict) -> str:
+    """Hash a slide's inputs: builder source (which pins its layout index), text, chart data and image content."""
+    params = {}
+    for name, value in kwargs.items():
+        if isinstance(value, Path):
+            value = {"path": str(value), "sha256": file_hash(value)}
+        elif isinstance(value, bytes):
+            value = {"name": getattr(value, "name", None), "sha256": hashlib.sha256(value).hexdigest()}
+        params[name] = value
+    return generator_key(builder, params, MANIFEST_VERSION)
+
+
+def template_fingerprint(template) -> str:
+    return hashlib.sha256(template_bytes(template)).hexdigest()
+
+
+def _output_stamp(output_path: Path) -> list[int]:
+    stat = output_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_previous(
+    output_path: Path, template, options: dict | None = None, code: dict | None = None
+) -> tuple[Presentation, list[str]] | None:
+    """Open the last build of ``output_path`` if its manifest still describes it."""
+    from pptx import Presentation
+
+    manifest_path = manifest_path_for(output_path)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("template") != template_fingerprint(template)
+        or manifest.get("options", {}) != (options or {})
+        or manifest.get("code", {}) != (code or {})
+        or not output_path.exists()
+        or manifest.get("output") != _output_stamp(output_path)
+    ):
+        return None
+    prs = Presentation(str(output_path))
+    if len(prs.slides) != len(manifest["slides"]):
+        return None
+    return prs, manifest["slides"]
+
+
+def build_incremental(
+    jobs: list[tuple],
+    output_path: Path,
+    add_slide,
+    template=None,
+    options: dict | None = None,
+    code: dict | None = None,
+) -> dict:
+    """Build ``jobs`` into ``output_path``, reusing slides of the previous build whose fingerprint is unchanged.
+
+    ``add_slide(prs, index, builder, kwargs)`` appends one freshly built slide.
+    Reused slides keep their parsed XML and media parts from the old package;
+    changed or new slides are built, stale ones dropped, and the slide list is
+    put back into spec order before saving. ``options`` records build settings
+    that ``add_slide`` applies on top of the job (e.g. overflow handling) and
+    ``code`` fingerprints the helpers and packages the builders use; a change
+    in either rebuilds every slide, since slide fingerprints only cover the
+    builder's own source.
+    """
+    output_path = Path(output_path)
+    fingerprints = [slide_fingerprint(builder, kwargs) for builder, kwargs in jobs]
+    previous = load_previous(output_path, template, options, code)
+    if previous is None:
+        prs, old_fingerprints = new_presentation(template), []
+    else:
+        prs, old_fingerprints = previous
+
+    sldIdLst = prs.slides._sldIdLst
+    available: dict[str, list] = {}
+    for sldId, fingerprint in zip(list(sldIdLst), old_fingerprints):
+        available.setdefault(fingerprint, []).append(sldId)
+
+    order = []
+    rebuilt = 0
+    for index, ((builder, kwargs), fingerprint) in enumerate(zip(jobs, fingerprints)):
+        reusable = available.get(fingerprint)
+        if reusable:
+            order.append(reusable.pop(0))
+            continue
+        add_slide(prs, index, builder, kwargs)
+        order.append(sldIdLst[-1])
+        rebuilt += 1
+
+    removed = 0
+    for stale in available.values():
+        for sldId in stale:
+            sldIdLst.remove(sldId)
+            prs.part.drop_rel(sldId.rId)
+            removed += 1
+
+    for sldId in order:
+        # Re-appending an lxml element moves it, leaving the list in spec order.
+        sldIdLst.append(sldId)
+    prs.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+
+    with tracing.span("save", slides=len(order)):
+        prs.save(output_path)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "template": template_fingerprint(template),
+        "options": options or {},
+        "code": code or {},
+        "output": _output_stamp(output_path),
+        "slides": fingerprints,
+    }
+    manifest_path_for(output_path).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return {"slides": len(order), "reused": len(order) - rebuilt, "rebuilt": rebuilt, "removed": removed}
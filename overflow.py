@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from functools import lru_cache
+
+from fonts import FONTS
+
+
+EMU_PER_POINT = 12700
+# PowerPoint's single line spacing is about 1.2x the font size.
+LINE_SPACING = 1.2
+DEFAULT_SIZE_PT = 18
+MIN_SIZE_PT = 10
+OVERFLOW_MODES = ("warn", "shrink", "error")
+# The default theme font is Calibri; Carlito shares its metrics. DejaVu runs
+# wider, so without Carlito the estimate errs toward flagging.
+REGULAR_FAMILIES = ("Carlito-Regular.ttf", "DejaVuSans.ttf")
+BOLD_FAMILIES = ("Carlito-Bold.ttf", "DejaVuSans-Bold.ttf")
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_A = "{%s}" % _NS["a"]
+_P = "{%s}" % _NS["p"]
+# bodyPr insets in EMU when the attribute is absent (0.1in sides, 0.05in top and bottom).
+_DEFAULT_INSETS = {"lIns": 91440, "rIns": 91440, "tIns": 45720, "bIns": 45720}
+
+_TITLE_TEXT = "string(./p:sp[p:nvSpPr/p:nvPr/p:ph[@type='title' or @type='ctrTitle']]/p:txBody)"
+
+_placeholder_sizes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=None)
+def text_family(bold: bool = False) -> str:
+    """First installed metric font, else the last candidate, which measures with Pillow's built-in font."""
+    families = BOLD_FAMILIES if bold else REGULAR_FAMILIES
+    family = next((family for family in families if FONTS.resolve(family)), None)
+    if family is not None:
+        return family
+    if not FONTS.scalable(families[-1]):
+        raise ValueError(f"no scalable font to measure text with; install one of {', '.join(families)}")
+    print(
+        f"warning: none of {', '.join(families)} is installed; overflow estimates use Pillow's built-in font",
+        file=sys.stderr,
+    )
+    return families[-1]
+
+
+def wrap_paragraph(text: str, size_pt: float, width_emu: int, family: str) -> list[str]:
+    """Break one paragraph into the lines PowerPoint would show in a box ``width_emu`` wide."""
+    limit = width_emu / EMU_PER_POINT
+    space = FONTS.text_width(" ", size_pt, family)
+    lines = []
+    for segment in text.split("\v"):
+        line, used = [], 0.0
+        for word in segment.split():
+            width = FONTS.text_width(word, size_pt, family)
+            if line and used + space + width <= limit:
+                line.append(word)
+                used += space + width
+                continue
+            if line:
+                lines.append(" ".join(line))
+            # A word wider than the box is broken across lines.
+            while width > limit and len(word) > 1:
+                cut = next(
+                    (end for end in range(len(word) - 1, 0, -1) if FONTS.text_width(word[:end], size_pt, family) <= limit),
+                    1,
+                )
+                lines.append(word[:cut])
+                word = word[cut:]
+                width = FONTS.text_width(word, size_pt, family)
+            line, used = [word], width
+        lines.append(" ".join(line))
+    return lines
+
+
+@lru_cache(maxsize=65536)
+def wrapped_lines(text: str, size_pt: float, width_emu: int, family: str) -> int:
+    return len(wrap_paragraph(text, size_pt, width_emu, family))
+
+
+def text_height(paragraphs: list[tuple[str, float, bool]], width_emu: int, scale: float = 1.0) -> float:
+    """Height in points of ``(text, size_pt, bold)`` paragraphs wrapped to ``width_emu``."""
+    height = 0.0
+    for text, size, bold in paragraphs:
+        size = size * scale
+        height += wrapped_lines(text, size, width_emu, text_family(bold)) * size * LINE_SPACING
+    return height
+
+
+@lru_cache(maxsize=None)
+def _xpath(path: str):
+    # python-pptx compiles its xpath() strings on every call; at thousands of slides that dominates.
+    from lxml import etree
+
+    return etree.XPath(path, namespaces=_NS)
+
+
+def _paragraph(p) -> tuple[str, float, bool]:
+    parts, sizes, bold = [], [], False
+    for child in p:
+        if child.tag == _A + "br":
+            parts.append("\v")
+            continue
+        if child.tag == _A + "pPr":
+            props = child.find(_A + "defRPr")
+        elif child.tag in (_A + "r", _A + "fld"):
+            parts.append(child.findtext(_A + "t") or "")
+            props = child.find(_A + "rPr")
+        else:
+            continue
+        if props is not None:
+            if props.get("sz"):
+                sizes.append(int(props.get("sz")) / 100)
+            bold = bold or props.get("b") in ("1", "true")
+    return "".join(parts), max(sizes, default=DEFAULT_SIZE_PT), bold
+
+
+def _extent(sp, slide) -> tuple[int, int] | None:
+    ext = _xpath("./p:spPr/a:xfrm/a:ext")(sp)
+    if ext:
+        return int(ext[0].get("cx")), int(ext[0].get("cy"))
+    ph = _xpath("./p:nvSpPr/p:nvPr/p:ph")(sp)
+    if not ph:
+        return None
+    # Placeholders without their own size inherit it from the layout; resolve that once per layout.
+    sizes = _placeholder_sizes.setdefault(slide.slide_layout.part, {})
+    key = (ph[0].get("type"), ph[0].get("idx"))
+    if key not in sizes:
+        shape = next(shape for shape in slide.shapes if shape._element is sp)
+        sizes[key] = (shape.width, shape.height) if shape.width is not None and shape.height is not None else None
+    return sizes[key]
+
+
+def _shrink(paragraphs, scale: float):
+    for p in paragraphs:
+        sized = _xpath("./a:pPr/a:defRPr[@sz] | ./a:r/a:rPr[@sz]")(p)
+        if not sized:
+            sized = [p.get_or_add_pPr().get_or_add_defRPr()]
+            sized[0].set("sz", str(DEFAULT_SIZE_PT * 100))
+        for rPr in sized:
+            rPr.set("sz", str(max(100, int(int(rPr.get("sz")) * scale))))
+
+
+def check_slide(slide, index: int, mode: str = "warn") -> list[dict]:
+    """Estimate whether each wrapping text box on ``slide`` overflows and act on it.
+
+    ``warn`` reports to stderr, ``shrink`` lowers font sizes in whole points
+    (not below ``MIN_SIZE_PT``) until the text fits, and ``error`` raises
+    ``ValueError``. Returns one record per overflowing box.
+    """
+    issues = []
+    for sp in slide.shapes._spTree.iterchildren(_P + "sp"):
+        body_pr = _xpath("./p:txBody/a:bodyPr")(sp)
+        extent = _extent(sp, slide) if body_pr else None
+        if extent is None or body_pr[0].get("wrap") == "none":
+            continue
+        insets = {name: int(body_pr[0].get(name, default)) for name, default in _DEFAULT_INSETS.items()}
+        width = extent[0] - insets["lIns"] - insets["rIns"]
+        box = (extent[1] - insets["tIns"] - insets["bIns"]) / EMU_PER_POINT
+        p_elements = _xpath("./p:txBody/a:p")(sp)
+        paragraphs = [_paragraph(p) for p in p_elements]
+        needed = text_height(paragraphs, width)
+        if needed <= box:
+            continue
+
+        size = max(size for _, size, _ in paragraphs)
+        name = _xpath("string(./p:nvSpPr/p:cNvPr/@name)")(sp)
+        issue = {
+            "slide": index + 1,
+            "shape": name,
+            "size_pt": size,
+            "needed_in": round(needed / 72, 2),
+            "box_in": round(box / 72, 2),
+        }
+        issues.append(issue)
+        title = _xpath(_TITLE_TEXT)(slide.shapes._spTree) or paragraphs[0][0]
+        where = f"slide {index + 1} ({title[:40]!r}) {name}"
+        if mode == "error":
+            raise ValueError(f"{where}: text needs {issue['needed_in']}in but the box holds {issue['box_in']}in")
+        if mode == "shrink":
+            fitted = next(
+                (target for target in range(int(size) - 1, MIN_SIZE_PT - 1, -1) if text_height(paragraphs, width, target / size) <= box),
+                MIN_SIZE_PT,
+            )
+            _shrink(p_elements, fitted / size)
+            issue["fitted_pt"] = fitted
+            outcome = "to fit" if text_height(paragraphs, width, fitted / size) <= box else "and it still overflows"
+            print(f"shrank {where} from {size:g}pt to {fitted}pt {outcome}", file=sys.stderr)
+        else:
+            print(f"warning: {where} overflows: needs {issue['needed_in']}in, box holds {issue['box_in']}in", file=sys.stderr)
+    return issues
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import tracing
+from asset_cache import DEFAULT_MAX_BYTES, prune_directory, touch
+from charts import draw_chart
+from deck_spec import iter_raw_specs, normalize_spec
+from fonts import FONTS
+from generate_presentation import (
+    CACHE_DIR,
+    CHART_MODE,
+    DEFAULT_DECK,
+    add_bullet_slide,
+    add_title_slide,
+    ensure_assets,
+    required_assets,
+    slide_jobs,
+)
+from incremental import slide_fingerprint, template_fingerprint
+from overflow import LINE_SPACING, text_family, wrap_paragraph
+from templates import new_presentation
+
+
+EMU_PER_INCH = 914400
+EMU_PER_POINT = 12700
+DEFAULT_WIDTH = 320
+# Bump when drawing changes so cached thumbnails are redrawn.
+PREVIEW_VERSION = 3
+PREVIEW_DIR = CACHE_DIR / "previews"
+
+_geometry: dict[str, dict] = {}
+# Resized pictures kept in memory, least recently used dropped first; long-running callers stay bounded.
+MAX_PICTURES = 64
+_pictures: OrderedDict[tuple, object] = OrderedDict()
+
+
+def inches(value: float) -> int:
+    return int(value * EMU_PER_INCH)
+
+
+def template_geometry(template=None, cache_dir: Path = PREVIEW_DIR) -> dict:
+    """Slide size and the "Title Only" title box of a template, kept on disk so warm runs skip python-pptx."""
+    fingerprint = template_fingerprint(template)
+    if fingerprint in _geometry:
+        return _geometry[fingerprint]
+    path = cache_dir / f"template-{fingerprint[:24]}.json"
+    try:
+        geometry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        prs = new_presentation(template)
+        title = prs.slide_layouts[5].placeholders[0]  # layout used by add_bullet_slide
+        geometry = {
+            "slide": [prs.slide_width, prs.slide_height],
+            "title": [title.left, title.top, title.width, title.height],
+        }
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(geometry), encoding="utf-8")
+    _geometry[fingerprint] = geometry
+    return geometry
+
+
+class Canvas:
+    """A Pillow image addressed in EMU, so drawing code can reuse the builders' Inches() geometry."""
+
+    def __init__(self, slide_size: tuple[int, int], width: int, color: str = "#ffffff"):
+        from PIL import Image, ImageDraw
+
+        self.scale = width / slide_size[0]
+        self.image = Image.new("RGB", (width, max(1, round(slide_size[1] * self.scale))), color)
+        self.draw = ImageDraw.Draw(self.image)
+
+    def px(self, emu: float) -> int:
+        return round(emu * self.scale)
+
+    def box(self, left, top, width, height) -> list[int]:
+        return [self.px(left), self.px(top), self.px(left + width), self.px(top + height)]
+
+    def picture(self, image, left, top, width=None, height=None):
+        """Paste ``image`` (path or bytes) sized like python-pptx's add_picture: a missing side keeps aspect."""
+        from PIL import Image
+
+        source = Path(image) if not isinstance(image, bytes) else None
+        stamp = (str(source), source.stat().st_mtime_ns) if source else hashlib.sha1(image).hexdigest()
+        with Image.open(source or io.BytesIO(image)) as img:
+            src_w, src_h = img.size
+            if width is None:
+                width = height * src_w / src_h
+            if height is None:
+                height = width * src_h / src_w
+            size = (max(1, self.px(width)), max(1, self.px(height)))
+            key = (stamp, size)
+            if key in _pictures:
+                _pictures.move_to_end(key)
+            else:
+                _pictures[key] = img.convert("RGBA").resize(size, Image.Resampling.BILINEAR)
+                while len(_pictures) > MAX_PICTURES:
+                    _pictures.popitem(last=False)
+        picture = _pictures[key]
+        self.image.paste(picture, (self.px(left), self.px(top)), picture)
+
+    def text(self, paragraphs, left, top, width, height, size_pt: float, color: str, bold: bool = False, wrap: bool = True):
+        """Draw paragraphs inside a text box, clipped to its height; ``wrap`` mirrors the box's word_wrap."""
+        family = text_family(bold)
+        font = FONTS.get(max(1, self.px(size_pt * EMU_PER_POINT)), family)
+        inner = width - 2 * 91440  # default left/right insets
+        line_height = size_pt * LINE_SPACING * EMU_PER_POINT
+        y = top + 45720
+        for paragraph in paragraphs:
+            lines = wrap_paragraph(paragraph, size_pt, inner, family) if wrap else paragraph.split("\v")
+            for line in lines:
+                if y + line_height > top + height + line_height / 2:
+                    return
+                self.draw.text((self.px(left + 91440), self.px(y)), line, fill=color, font=font)
+                y += line_height
+
+    def save(self, path: Path):
+        from PIL import Image
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        # A 256-colour palette keeps thumbnails small and encodes several times faster than optimize=True.
+        self.image.quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+
+
+def draw_title_slide(canvas: Canvas, geometry: dict, kwargs: dict):
+    slide_w, slide_h = geometry["slide"]
+    canvas.picture(kwargs["background"], 0, 0, slide_w, slide_h)
+    canvas.text(kwargs["title"].split("\n"), inches(0.8), inches(1.4), inches(8.5), inches(2.2), 54, "#ffffff", bold=True)
+    # add_title_slide only turns on word_wrap for the title; the other boxes keep each line whole.
+    canvas.text(kwargs["subtitle"].split("\n"), inches(0.8), inches(3), inches(6.5), inches(1.2), 32, "#ffffff", wrap=False)
+    canvas.text(kwargs["presenter"].split("\n"), inches(0.8), inches(4), inches(6.5), inches(1.5), 22, "#ffffff", wrap=False)
+    canvas.picture(kwargs["logo"], inches(9.5), inches(0.6), height=inches(1.6))
+
+
+def draw_bullet_slide(canvas: Canvas, geometry: dict, kwargs: dict):
+    left, top, width, height = geometry["title"]
+    canvas.text([kwargs["title"]], left, top, width, height, 40, "#000000")
+    canvas.text(kwargs["bullets"], inches(0.7), inches(1.8), inches(6.5), inches(4.5), 24, "#000000")
+    if kwargs.get("chart"):
+        draw_chart(canvas.draw, canvas.box(inches(7.5), inches(2), inches(3.8), inches(2.4)), kwargs["chart"])
+    elif kwargs.get("image_path"):
+        canvas.picture(kwargs["image_path"], inches(7.5), inches(2), width=inches(3.8))
+
+
+RENDERERS = {add_title_slide: draw_title_slide, add_bullet_slide: draw_bullet_slide}
+
+
+def _with_defaults(builder, kwargs: dict) -> dict:
+    defaults = {
+        name: param.default
+        for name, param in inspect.signature(builder).parameters.items()
+        if param.default is not inspect.Parameter.empty
+    }
+    return {**defaults, **kwargs}
+
+
+def render_previews(
+    spec: dict | None = None,
+    width: int = DEFAULT_WIDTH,
+    chart_mode: str = CHART_MODE,
+    cache_dir: Path = PREVIEW_DIR,
+    max_cache_bytes: int = DEFAULT_MAX_BYTES,
+) -> list[Path]:
+    """Return one cached PNG thumbnail per slide of ``spec``, drawing only slides whose fingerprint is new.
+
+    Thumbnails are drawn with Pillow from the same jobs the deck is built from,
+    reusing the builders' geometry, so no deck is built or converted. Text and
+    pictures are placed faithfully; native charts are simplified. The cache is
+    pruned to ``max_cache_bytes`` like the asset cache.
+    """
+    spec = normalize_spec(spec or DEFAULT_DECK)
+    ensure_assets(names=required_assets(spec, chart_mode))
+    geometry = template_geometry(spec.get("template"), cache_dir)
+    template = template_fingerprint(spec.get("template"))
+    paths = []
+    for index, (builder, kwargs) in enumerate(slide_jobs(spec, image_dpi=None, chart_mode=chart_mode)):
+        key = hashlib.sha256(
+            f"{slide_fingerprint(builder, kwargs)}:{template}:{width}:{PREVIEW_VERSION}".encode("ascii")
+        ).hexdigest()[:32]
+        path = cache_dir / f"{key}.png"
+        if path.exists():
+            touch(path)
+        else:
+            with tracing.span("preview", index=index):
+                canvas = Canvas(geometry["slide"], width)
+                RENDERERS[builder](canvas, geometry, _with_defaults(builder, kwargs))
+                canvas.save(path)
+        paths.append(path)
+    # This deck's thumbnails were just written or touched, so they are the last to go.
+    prune_directory(cache_dir, max_bytes=max_cache_bytes)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draw PNG slide thumbnails straight from deck specs.")
+    parser.add_argument("source", nargs="?", help="spec directory, .json or .jsonl file (default: the built-in deck)")
+    parser.add_argument("--out-dir", type=Path, default=Path("previews"), help="where <deck>-NNN.png thumbnails are copied")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="thumbnail width in pixels")
+    parser.add_argument("--charts", choices=("native", "raster"), default=CHART_MODE)
+    args = parser.parse_args(argv)
+
+    specs = iter_raw_specs(args.source) if args.source else [(DEFAULT_DECK["name"], DEFAULT_DECK)]
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    for name, raw in specs:
+        started = time.perf_counter()
+        try:
+            if isinstance(raw, Exception):
+                raise raw
+            spec = normalize_spec(raw, name=name)
+            paths = render_previews(spec, width=args.width, chart_mode=args.charts)
+        except (OSError, ValueError) as exc:
+            failed += 1
+            print(f"ERR {name}  {exc}")
+            continue
+        for index, path in enumerate(paths, start=1):
+            shutil.copyfile(path, args.out_dir / f"{spec['name']}-{index:03d}.png")
+        print(f"ok  {spec['name']}  {len(paths)} thumbnails in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import io
+import os
+import re
+import time
+import zipfile
+
+
+# Earliest timestamp a zip entry can hold; used unless SOURCE_DATE_EPOCH is set.
+DEFAULT_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_EMBEDDED_PACKAGES = (".xlsx", ".xlsm", ".docx", ".pptx")
+_CORE_DATES = re.compile(rb"(<dcterms:(created|modified)\b[^>]*>)[^<]*(</dcterms:\2>)")
+
+
+def build_date_time() -> tuple[int, ...]:
+    """Timestamp stamped into reproducible builds, taken from ``SOURCE_DATE_EPOCH`` when set."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return DEFAULT_DATE_TIME
+    return max(DEFAULT_DATE_TIME, tuple(time.gmtime(int(epoch))[:6]))
+
+
+def zip_info(name: str, date_time: tuple[int, ...]) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    # Host OS and permission bits would otherwise differ between Linux, macOS and Windows builds.
+    info.create_system = 0
+    info.external_attr = 0
+    return info
+
+
+def normalize_member(name: str, blob: bytes, date_time: tuple[int, ...]) -> bytes:
+    """Pin the parts of a package member that change from run to run.
+
+    Core property dates are set to ``date_time``, and embedded packages such as
+    the workbooks behind native charts are normalized recursively.
+    """
+    if name.lower().endswith(_EMBEDDED_PACKAGES):
+        buffer = io.BytesIO()
+        normalize_package(io.BytesIO(blob), buffer, date_time)
+        return buffer.getvalue()
+    if name == "docProps/core.xml":
+        stamp = "%04d-%02d-%02dT%02d:%02d:%02dZ" % date_time
+        return _CORE_DATES.sub(rb"\g<1>" + stamp.encode("ascii") + rb"\g<3>", blob)
+    return blob
+
+
+def normalize_package(source, target, date_time: tuple[int, ...] | None = None):
+    """Copy an OOXML zip member by member with fixed timestamps and metadata in a stable order."""
+    date_time = date_time or build_date_time()
+    with zipfile.ZipFile(source) as package, zipfile.ZipFile(target, "w") as out:
+        # [Content_Types].xml first, as Office writes it, then everything else by name.
+        for name in sorted(package.namelist(), key=lambda name: (name != "[Content_Types].xml", name)):
+            out.writestr(zip_info(name, date_time), normalize_member(name, package.read(name), date_time))
+
+
+def save_reproducible(prs, output, date_time: tuple[int, ...] | None = None):
+    """Save ``prs`` to a path or writable stream so identical content gives identical bytes."""
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    buffer.seek(0)
+    normalize_package(buffer, output, date_time)
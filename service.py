@@ -0,0 +1,224 @@
+import argparse
+import asyncio
+import io
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from pathlib import PurePath
+from urllib.parse import quote
+
+from deck_spec import normalize_spec
+from generate_presentation import ASSET_SPECS, DEFAULT_DECK, build_deck, resolve_workers
+
+
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+# Requests accepted beyond the busy workers before answering 429.
+QUEUE_SIZE = 8
+REQUEST_TIMEOUT = 30.0
+MAX_BODY_BYTES = 4 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+_CONTROL = re.compile(r"[\x00-\x1f\x7f\"]")
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9 ._()-]")
+
+
+def _warm_worker(template):
+    """Pool initializer: parse the template, resolve fonts and render assets and their variants once per worker."""
+    from fonts import FONTS
+    from templates import warm
+
+    warm(template)
+    FONTS.resolve()
+    spec = normalize_spec(DEFAULT_DECK)
+    spec["template"] = template
+    build_deck(spec, assets_dir=None).save(io.BytesIO())
+
+
+def check_request_spec(spec: dict) -> dict:
+    """Limit an untrusted spec to the generated assets; the template comes only from ``--template``."""
+    spec.pop("template", None)
+    images = [spec.get("background"), spec.get("logo")] + [slide["image"] for slide in spec["slides"]]
+    for image in filter(None, images):
+        if PurePath(image).name != image or image not in ASSET_SPECS:
+            raise ValueError(f"image {image!r} is not one of the service's assets: {sorted(ASSET_SPECS)}")
+    return spec
+
+
+def content_disposition(filename: str) -> str:
+    """An attachment header safe for any deck name: an ASCII fallback plus the RFC 5987 UTF-8 form."""
+    name = PurePath(_CONTROL.sub("", filename).replace("\\", "/")).name or "deck.pptx"
+    fallback = _UNSAFE_FILENAME.sub("_", name)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(name, safe='')}"
+
+
+def render_deck(spec: dict) -> bytes:
+    # Assets come from the worker's in-memory renders, so the service needs no writable disk.
+    prs = build_deck(spec, assets_dir=None)
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+class DeckService:
+    """Serves ``POST /decks`` with a bounded process pool behind a fixed-size admission queue.
+
+    At most ``workers + queue_size`` requests are admitted; the rest get 429 with
+    ``Retry-After``. A request that times out answers 504, but its slot is only
+    released once the worker really finishes, so the pool is never oversubscribed.
+    """
+
+    def __init__(self, workers=None, queue_size=QUEUE_SIZE, timeout=REQUEST_TIMEOUT, template=None):
+        self.workers = resolve_workers(workers)
+        self.capacity = self.workers + queue_size
+        self.timeout = timeout
+        self.template = str(template) if template else None
+        self.in_flight = 0
+        self.served = 0
+        self.rejected = 0
+        self.pool = None
+
+    def start_pool(self):
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker, initargs=(self.template,))
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            method, path, body = await self._read_request(reader)
+            if method == "GET" and path == "/health":
+                await self._respond(writer, HTTPStatus.OK, self.stats())
+            elif method == "POST" and path == "/decks":
+                await self._render(writer, body)
+            else:
+                await self._respond(writer, HTTPStatus.NOT_FOUND, {"error": f"no route for {method} {path}"})
+        except (ValueError, TypeError, AttributeError, KeyError) as exc:
+            # Anything raised before a build starts comes from the request itself.
+            await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": f"invalid request: {exc}"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "served": self.served,
+            "rejected": self.rejected,
+        }
+
+    async def _render(self, writer: asyncio.StreamWriter, body: bytes):
+        spec = check_request_spec(normalize_spec(json.loads(body)))
+        if self.template:
+            spec["template"] = self.template
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            await self._respond(writer, HTTPStatus.TOO_MANY_REQUESTS, {"error": "deck queue is full"}, {"Retry-After": "1"})
+            return
+
+        started = time.perf_counter()
+        self.in_flight += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, render_deck, spec)
+        except BrokenProcessPool:
+            self.in_flight -= 1
+            self.start_pool()
+            await self._respond(writer, HTTPStatus.SERVICE_UNAVAILABLE, {"error": "worker pool restarted"})
+            return
+        future.add_done_callback(self._release)
+        try:
+            # shield() keeps a timed-out build running so its slot is freed by _release, not here.
+            data = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            await self._respond(writer, HTTPStatus.GATEWAY_TIMEOUT, {"error": f"deck took longer than {self.timeout}s"})
+            return
+        except BrokenProcessPool:
+            self.start_pool()
+            await self._respond(writer, HTTPStatus.SERVICE_UNAVAILABLE, {"error": "worker pool restarted"})
+            return
+        except Exception as exc:
+            await self._respond(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        headers = {
+            "Content-Type": PPTX_TYPE,
+            "Content-Disposition": content_disposition(spec["output"]),
+            "X-Render-Seconds": f"{time.perf_counter() - started:.3f}",
+        }
+        head = self._head(HTTPStatus.OK, headers, len(data))
+        self.served += 1
+        writer.write(head)
+        await writer.drain()
+        view = memoryview(data)
+        for offset in range(0, len(view), CHUNK_BYTES):
+            writer.write(view[offset : offset + CHUNK_BYTES])
+            await writer.drain()
+
+    def _release(self, future):
+        self.in_flight -= 1
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            raise ValueError("malformed request line")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"request body over {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0].upper(), request_line[1], body
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict, headers: dict | None = None):
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(self._head(status, {"Content-Type": "application/json", **(headers or {})}, len(data)))
+        writer.write(data)
+        await writer.drain()
+
+    def _head(self, status: HTTPStatus, headers: dict, length: int) -> bytes:
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Length: {length}", "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("ascii")
+
+
+async def serve(host: str, port: int, service: DeckService):
+    service.start_pool()
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Serving decks on http://{host}:{port}/decks with {service.workers} workers", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render decks over HTTP: POST a JSON deck spec to /decks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=0, help="deck build processes (0 = one per CPU)")
+    parser.add_argument("--queue", type=int, default=QUEUE_SIZE, help="requests waiting for a worker before 429")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT, help="seconds before a request answers 504")
+    parser.add_argument("--template", help="template used for every deck, overriding the spec")
+    args = parser.parse_args(argv)
+    service = DeckService(workers=args.workers, queue_size=args.queue, timeout=args.timeout, template=args.template)
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import tracing
+from reproducible import normalize_member, zip_info
+from templates import new_presentation
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part
+
+
+_NUMBERED_PARTNAME = re.compile(r"^(.*?)(\d*)(\.\w+)$")
+
+
+class StreamingDeckWriter:
+    """Writes a deck into a zip one slide at a time.
+
+    Each slide is built on a scratch Presentation cloned from the template,
+    serialized together with the parts it owns (pictures, charts, embedded
+    workbooks) straight into the output zip, and then unlinked from the scratch
+    deck so its XML tree can be freed. Only the template parts, slide names and
+    media hashes stay in memory. Identical media is written once and shared.
+    The presentation part, template parts and ``[Content_Types].xml`` are written
+    on :meth:`close`. With ``date_time`` every entry gets that fixed timestamp and
+    run-dependent metadata is pinned, as in a reproducible build.
+    """
+
+    def __init__(self, output, template=None, date_time: tuple[int, ...] | None = None):
+        from pptx.opc.spec import default_content_types
+
+        self._default_content_types = set(default_content_types)
+        self.prs = new_presentation(template)
+        self._zip = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+        self._date_time = date_time
+        self._sldIdLst = self.prs.slides._sldIdLst
+        for sldId in list(self._sldIdLst):
+            # Slides shipped inside a template are not part of the streamed deck.
+            self._sldIdLst.remove(sldId)
+            self.prs.part.drop_rel(sldId.rId)
+        self._template_order = list(self.prs.part.package.iter_parts())
+        self._template_parts = set(self._template_order)
+        self._slide_partnames: list[str] = []
+        self._media: dict[str, str] = {}
+        self._counters: dict[tuple[str, str], int] = {}
+        self._defaults = {"rels": "application/vnd.openxmlformats-package.relationships+xml", "xml": "application/xml"}
+        self._overrides: dict[str, str] = {}
+
+    def add(self, add_slide, index: int, builder, kwargs: dict):
+        """Build one slide with ``add_slide(prs, index, builder, kwargs)`` and flush it to the zip."""
+        add_slide(self.prs, index, builder, kwargs)
+        sldId = self._sldIdLst[-1]
+        slide_part = self.prs.part.related_part(sldId.rId)
+        with tracing.span("flush_slide", index=index):
+            partname = f"/ppt/slides/slide{len(self._slide_partnames) + 1}.xml"
+            self._write_part(slide_part, partname, {slide_part: partname})
+        self._slide_partnames.append(partname)
+        self._sldIdLst.remove(sldId)
+        self.prs.part.drop_rel(sldId.rId)
+
+    @property
+    def slide_count(self) -> int:
+        return len(self._slide_partnames)
+
+    def abort(self):
+        self._zip.close()
+
+    def close(self) -> dict:
+        from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+        from pptx.opc.packuri import PackURI
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+        prs_part = self.prs.part
+        for part in self._template_order:
+            if part is not prs_part:
+                self._write_blob(part.partname, part.blob, part.content_type)
+                if len(part.rels):
+                    self._writestr(part.partname.rels_uri[1:], part.rels.xml)
+
+        prs_element = copy.deepcopy(prs_part._element)
+        sldIdLst = prs_element.get_or_add_sldIdLst()
+        rels = CT_Relationships.new()
+        rId_base = 0
+        for rId, rel in prs_part.rels.items():
+            rels.add_rel(rId, rel.reltype, rel.target_ref, rel.is_external)
+            if rId[3:].isdigit():
+                rId_base = max(rId_base, int(rId[3:]))
+        for idx, partname in enumerate(self._slide_partnames, start=1):
+            rId = f"rId{rId_base + idx}"
+            rels.add_rel(rId, RT.SLIDE, PackURI(partname).relative_ref(prs_part.partname.baseURI), False)
+            sldIdLst._add_sldId(id=255 + idx, rId=rId)
+        self._write_blob(prs_part.partname, serialize_part_xml(prs_element), prs_part.content_type)
+        self._writestr(prs_part.partname.rels_uri[1:], rels.xml_file_bytes)
+        self._writestr("_rels/.rels", prs_part.package._rels.xml)
+        self._writestr("[Content_Types].xml", self._content_types_xml())
+        self._zip.close()
+        return {"slides": len(self._slide_partnames), "media": len(self._media)}
+
+    def _write_part(self, part: Part, partname: str, names: dict) -> None:
+        from pptx.opc.oxml import CT_Relationships
+        from pptx.opc.packuri import PackURI
+
+        self._write_blob(partname, part.blob, part.content_type)
+        if not len(part.rels):
+            return
+        base_uri = PackURI(partname).baseURI
+        rels = CT_Relationships.new()
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rels.add_rel(rId, rel.reltype, rel.target_ref, True)
+                continue
+            target_name = self._partname_for(rel.target_part, names)
+            rels.add_rel(rId, rel.reltype, PackURI(target_name).relative_ref(base_uri), False)
+        self._writestr(PackURI(partname).rels_uri[1:], rels.xml_file_bytes)
+
+    def _partname_for(self, part: Part, names: dict) -> str:
+        from pptx.opc.package import XmlPart
+
+        if part in self._template_parts:
+            return part.partname
+        if part in names:
+            return names[part]
+        if isinstance(part, XmlPart) or not part.content_type.startswith(("image/", "video/", "audio/")):
+            names[part] = self._next_partname(part.partname)
+            self._write_part(part, names[part], names)
+            return names[part]
+        digest = hashlib.sha1(part.blob).hexdigest()
+        if digest not in self._media:
+            self._media[digest] = self._next_partname(part.partname)
+            self._write_part(part, self._media[digest], names)
+        names[part] = self._media[digest]
+        return names[part]
+
+    def _next_partname(self, partname: str) -> str:
+        stem, _, ext = _NUMBERED_PARTNAME.match(partname).groups()
+        count = self._counters.get((stem, ext), 0) + 1
+        self._counters[(stem, ext)] = count
+        return f"{stem}{count}{ext}"
+
+    def _writestr(self, name: str, blob: bytes):
+        if self._date_time is None:
+            self._zip.writestr(name, blob)
+        else:
+            self._zip.writestr(zip_info(name, self._date_time), normalize_member(name, blob, self._date_time))
+
+    def _write_blob(self, partname: str, blob: bytes, content_type: str):
+        self._writestr(partname[1:], blob)
+        ext = partname.rsplit(".", 1)[-1]
+        if (ext.lower(), content_type) in self._default_content_types:
+            self._defaults[ext] = content_type
+        else:
+            self._overrides[partname] = content_type
+
+    def _content_types_xml(self) -> bytes:
+        from pptx.opc.oxml import CT_Types, serialize_part_xml
+
+        types = CT_Types.new()
+        for ext, content_type in sorted(self._defaults.items()):
+            types.add_default(ext, content_type)
+        for partname, content_type in sorted(self._overrides.items()):
+            types.add_override(partname, content_type)
+        return serialize_part_xml(types)
+
+
+def stream_deck(jobs, output_path, add_slide, template=None, date_time: tuple[int, ...] | None = None) -> dict:
+    """Build ``(builder, kwargs)`` jobs, which may be a lazy generator, into ``output_path`` with bounded memory.
+
+    ``output_path`` may also be a writable binary stream (even an unseekable
+    pipe). A file is written under a temporary name so a failing slide never
+    leaves a truncated deck where the previous one used to be. ``date_time``
+    makes the output reproducible (see :class:`StreamingDeckWriter`).
+    """
+    if hasattr(output_path, "write"):
+        return _write_deck(StreamingDeckWriter(output_path, template, date_time), jobs, add_slide)
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        stats = _write_deck(StreamingDeckWriter(tmp_path, template, date_time), jobs, add_slide)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, output_path)
+    return stats
+
+
+def _write_deck(writer: StreamingDeckWriter, jobs, add_slide) -> dict:
+    try:
+        for index, (builder, kwargs) in enumerate(jobs):
+            writer.add(add_slide, index, builder, kwargs)
+        with tracing.span("save", slides=writer.slide_count):
+            return writer.close()
+    except BaseException:
+        writer.abort()
+        raise
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import copy
+import importlib.util
+import io
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
+
+
+_TEMPLATE_MAIN = b"application/vnd.openxmlformats-officedocument.presentationml.template.main+xml"
+_PRESENTATION_MAIN = b"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+
+_snapshots: dict[str, bytes] = {}
+_parsed: dict[str, Presentation] = {}
+
+
+def default_template() -> Path:
+    # find_spec locates python-pptx's bundled template without importing the package.
+    return Path(importlib.util.find_spec("pptx").origin).parent / "templates" / "default.pptx"
+
+
+def template_bytes(template: Path | str | None = None) -> bytes:
+    """Read a template package once and keep its bytes.
+
+    ``.potx`` templates declare a template content type that python-pptx will not
+    open, so the snapshot is rewritten to a plain presentation package.
+    """
+    path = str(template or default_template())
+    if path not in _snapshots:
+        data = Path(path).read_bytes()
+        if path.lower().endswith(".potx"):
+            data = _as_presentation_package(data)
+        _snapshots[path] = data
+    return _snapshots[path]
+
+
+def _as_presentation_package(data: bytes) -> bytes:
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            blob = source.read(info)
+            if info.filename == "[Content_Types].xml":
+                blob = blob.replace(_TEMPLATE_MAIN, _PRESENTATION_MAIN)
+            target.writestr(info, blob)
+    return output.getvalue()
+
+
+def new_presentation(template: Path | str | None = None) -> Presentation:
+    """Return a fresh Presentation cloned from a template parsed once per process."""
+    from pptx import Presentation
+
+    path = str(template or default_template())
+    parsed = _parsed.get(path)
+    if parsed is None:
+        parsed = _parsed[path] = Presentation(io.BytesIO(template_bytes(path)))
+    try:
+        return copy.deepcopy(parsed)
+    except (TypeError, RecursionError):
+        return Presentation(io.BytesIO(template_bytes(path)))
+
+
+def warm(template: Path | str | None = None):
+    new_presentation(template)
+
+
+def clear():
+    _snapshots.clear()
+    _parsed.clear()
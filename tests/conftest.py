@@ -0,0 +1,72 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+SPEC = {
+    "name": "test deck",
+    "title": "Test Deck",
+    "subtitle": "Package checks",
+    "slides": [
+        {"title": "Overview", "bullets": ["First point", "Second point"], "image": "objectives.png"},
+        {
+            "title": "Sales",
+            "bullets": ["Up on last week"],
+            "chart": {"type": "bar", "categories": ["Mon", "Tue", "Wed"], "series": {"Orders": [3, 5, 4]}},
+        },
+        {
+            "title": "Menu",
+            "bullets": ["Prices"],
+            "chart": {"type": "table", "columns": ["Item", "Price"], "rows": [["Tea", "2"], ["Cake", "4"]]},
+        },
+        {"title": "Busy hours", "bullets": ["Lunch", "Evening"], "image": "busy_cafe.png"},
+    ],
+}
+
+
+@pytest.fixture(scope="session")
+def workdir(tmp_path_factory):
+    """A scratch working directory shared by the session: assets/ and .asset_cache/ are cwd-relative."""
+    from generate_presentation import ensure_assets
+
+    path = tmp_path_factory.mktemp("decks")
+    previous = os.getcwd()
+    os.chdir(path)
+    ensure_assets()
+    yield path
+    os.chdir(previous)
+
+
+def deck_text(source) -> list[list[str]]:
+    """Per slide, the text of every text frame and table cell, in shape order."""
+    from pptx import Presentation
+
+    slides = []
+    for slide in Presentation(source).slides:
+        texts = []
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                texts.append(shape.text_frame.text)
+            elif shape.has_table:
+                texts.extend(cell.text for row in shape.table.rows for cell in row.cells)
+        slides.append(texts)
+    return slides
+
+
+def deck_parts(source) -> list[list[str]]:
+    """Per slide, the kind of each picture, chart or table it holds, in shape order."""
+    from pptx import Presentation
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+    return [
+        [
+            "chart" if shape.has_chart else "table" if shape.has_table else "picture"
+            for shape in slide.shapes
+            if shape.has_chart or shape.has_table or shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+        ]
+        for slide in Presentation(source).slides
+    ]
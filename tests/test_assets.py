@@ -0,0 +1,104 @@
+import shutil
+import time
+
+import pytest
+
+import generate_presentation
+from asset_cache import AssetCache
+from generate_presentation import ASSETS_DIR, deck_hash, resolve_image
+
+
+def test_only_bare_names_and_assets_dir_paths_are_generated_assets(workdir):
+    from PIL import Image
+
+    custom = workdir / "outlet42" / "objectives.png"
+    custom.parent.mkdir(exist_ok=True)
+    Image.new("RGB", (8, 8), "red").save(custom)
+    relative = "outlet42/objectives.png"
+
+    assert resolve_image("objectives.png") == ASSETS_DIR / "objectives.png"
+    assert resolve_image(str(ASSETS_DIR / "objectives.png")) == ASSETS_DIR / "objectives.png"
+    assert resolve_image(relative) == custom.relative_to(workdir)
+    assert resolve_image(relative, assets_dir=None) == custom.read_bytes()
+
+    spec = {"title": "Outlet", "slides": [{"title": "Goals", "bullets": [], "image": relative}]}
+    before = deck_hash(spec)
+    Image.new("RGB", (8, 8), "blue").save(custom)
+    assert deck_hash(spec) != before
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    """Generator names rendered by each ensure_assets() call."""
+    calls = []
+    render_assets = generate_presentation.render_assets
+
+    def record(jobs, workers=1):
+        calls.append(sorted(generator.__name__ for generator, _, _ in jobs))
+        return render_assets(jobs, workers)
+
+    monkeypatch.setattr(generate_presentation, "render_assets", record)
+    return calls
+
+
+def test_changed_parameters_re_render_only_that_asset(tmp_path, rendered, monkeypatch):
+    assets, cache = tmp_path / "assets", tmp_path / "cache"
+    generate_presentation.ensure_assets(assets, cache)
+    generate_presentation.ensure_assets(assets, cache)
+    assert len(rendered[0]) == len(generate_presentation.ASSET_SPECS)
+    assert rendered[1] == []
+
+    before = (assets / "objectives.png").read_bytes()
+    generator, params = generate_presentation.ASSET_SPECS["objectives.png"]
+    monkeypatch.setitem(generate_presentation.ASSET_SPECS, "objectives.png", (generator, {**params, "caption": "New goals"}))
+    generate_presentation.ensure_assets(assets, cache)
+    assert rendered[2] == ["create_objective_icon"]
+    assert (assets / "objectives.png").read_bytes() != before
+
+
+def test_deleted_assets_are_copied_back_without_rendering(tmp_path, rendered):
+    assets, cache = tmp_path / "assets", tmp_path / "cache"
+    generate_presentation.ensure_assets(assets, cache)
+    originals = {path.name: path.read_bytes() for path in assets.iterdir()}
+    shutil.rmtree(assets)
+
+    generate_presentation.ensure_assets(assets, cache)
+    assert rendered[1] == []
+    assert {path.name: path.read_bytes() for path in assets.iterdir()} == originals
+
+
+def test_unchanged_assets_are_not_copied_again(tmp_path):
+    assets, cache = tmp_path / "assets", tmp_path / "cache"
+    generate_presentation.ensure_assets(assets, cache)
+    stamps = {path.name: path.stat().st_mtime_ns for path in assets.iterdir()}
+    generate_presentation.ensure_assets(assets, cache)
+    assert {path.name: path.stat().st_mtime_ns for path in assets.iterdir()} == stamps
+
+
+def cache_with_entries(root, sizes: dict[str, int], max_bytes: int) -> AssetCache:
+    cache = AssetCache(root, max_bytes=max_bytes)
+    for age, (key, size) in enumerate(sizes.items()):
+        path = cache.path_for(key, ".bin")
+        path.write_bytes(b"x" * size)
+        cache.store(key, f"{key}.bin", path)
+        # Earlier keys were used longer ago.
+        cache.entries[key]["last_used"] = time.time() - 100 * (len(sizes) - age)
+    return cache
+
+
+def test_byte_cap_evicts_least_recently_used_entries_outside_keep(tmp_path):
+    cache = cache_with_entries(tmp_path, {"oldest": 400, "old": 400, "newer": 400, "newest": 400}, max_bytes=1000)
+
+    evicted = cache.evict(keep={"oldest"})
+    assert evicted == ["old", "newer"]
+    assert set(cache.entries) == {"oldest", "newest"}
+    assert sorted(path.name for path in tmp_path.glob("*.bin")) == ["newest.bin", "oldest.bin"]
+
+
+def test_stale_entries_are_evicted_by_age(tmp_path):
+    cache = cache_with_entries(tmp_path, {"stale": 10, "fresh": 10}, max_bytes=10_000)
+    cache.max_age = 150
+
+    assert cache.evict() == ["stale"]
+    cache.save()
+    assert set(AssetCache(tmp_path).entries) == {"fresh"}
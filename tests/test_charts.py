@@ -0,0 +1,31 @@
+import importlib.util
+
+import charts
+from conftest import SPEC, deck_parts, deck_text
+from deck_spec import normalize_spec
+from generate_presentation import build_presentation
+
+
+def test_raster_mode_draws_charts_without_a_picture(workdir):
+    output = build_presentation(normalize_spec(SPEC), workdir / "raster.pptx", chart_mode="raster")
+
+    # The chart and table slides carry no image, so their data must be drawn, not dropped.
+    assert deck_parts(output) == [["picture", "picture"], ["picture"], ["picture"], ["picture"], ["picture"]]
+    assert deck_text(output)[2] == ["Sales", "Up on last week"]
+
+
+def test_render_chart_is_a_png_of_the_chart_data():
+    bar = charts.render_chart(SPEC["slides"][1]["chart"])
+    assert bar.startswith(b"\x89PNG")
+    assert charts.render_chart(SPEC["slides"][1]["chart"]) is bar
+    assert charts.render_chart({**SPEC["slides"][1]["chart"], "series": {"Orders": [1, 1, 9]}}) != bar
+
+
+def test_missing_xlsxwriter_warns_before_falling_back(monkeypatch, capsys):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None if name == "xlsxwriter" else find_spec(name))
+
+    assert charts.resolve_chart_mode("native") == "raster"
+    assert "XlsxWriter is not installed" in capsys.readouterr().err
+    assert charts.resolve_chart_mode("raster") == "raster"
+    assert capsys.readouterr().err == ""
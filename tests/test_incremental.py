@@ -0,0 +1,98 @@
+import copy
+import json
+import zipfile
+from pathlib import Path
+
+from conftest import SPEC, deck_parts, deck_text
+from deck_spec import normalize_spec
+from generate_presentation import add_job_slide, build_presentation, slide_jobs
+from incremental import build_incremental
+
+
+def build(spec: dict, output_path: Path) -> dict:
+    spec = normalize_spec(spec)
+    return build_incremental(slide_jobs(spec), output_path, add_job_slide)
+
+
+def fresh(spec: dict, output_path: Path) -> Path:
+    return build_presentation(normalize_spec(spec), output_path)
+
+
+def test_unchanged_rebuild_reuses_every_slide(workdir):
+    output = workdir / "same.pptx"
+    first = build(SPEC, output)
+    assert first["rebuilt"] == first["slides"] == len(SPEC["slides"]) + 1
+
+    second = build(SPEC, output)
+    assert second == {"slides": first["slides"], "reused": first["slides"], "rebuilt": 0, "removed": 0}
+    assert deck_text(output) == deck_text(fresh(SPEC, workdir / "same-fresh.pptx"))
+
+
+def test_edit_add_and_remove_match_fresh_build(workdir):
+    output = workdir / "changed.pptx"
+    build(SPEC, output)
+
+    spec = copy.deepcopy(SPEC)
+    del spec["slides"][0]
+    spec["slides"][1]["bullets"].append("Edited point")
+    spec["slides"].append({"title": "Next steps", "bullets": ["Ship it"], "image": "industry_graphic.png"})
+    stats = build(spec, output)
+
+    # Title, unchanged chart slide and unchanged image slide are reused; the edit and the new slide are built.
+    assert stats == {"slides": 5, "reused": 3, "rebuilt": 2, "removed": 2}
+    expected = fresh(spec, workdir / "changed-fresh.pptx")
+    assert deck_text(output) == deck_text(expected)
+    assert deck_parts(output) == deck_parts(expected)
+    with zipfile.ZipFile(output) as package:
+        names = package.namelist()
+        assert package.testzip() is None
+    assert len(names) == len(set(names))
+    # Slide parts are renumbered in spec order and dropped slides leave no parts behind.
+    assert sorted(name for name in names if name.startswith("ppt/slides/slide")) == sorted(
+        f"ppt/slides/slide{number}.xml" for number in range(1, 6)
+    )
+
+
+def test_reordered_slides_are_reused_in_spec_order(workdir):
+    output = workdir / "reordered.pptx"
+    build(SPEC, output)
+
+    spec = copy.deepcopy(SPEC)
+    spec["slides"].reverse()
+    stats = build(spec, output)
+
+    assert stats["rebuilt"] == 0
+    assert [texts[0] for texts in deck_text(output)[1:]] == [slide["title"] for slide in spec["slides"]]
+    assert deck_parts(output) == deck_parts(fresh(spec, workdir / "reordered-fresh.pptx"))
+
+
+def test_output_changed_outside_the_build_is_rebuilt(workdir):
+    output = workdir / "touched.pptx"
+    build(SPEC, output)
+    fresh(SPEC, output)  # overwritten by a plain build, so the manifest no longer describes it
+
+    stats = build(SPEC, output)
+    assert stats["reused"] == 0
+    assert deck_text(output) == deck_text(fresh(SPEC, workdir / "touched-fresh.pptx"))
+
+
+def test_changed_build_code_rebuilds_every_slide(workdir):
+    output = workdir / "code.pptx"
+    spec = normalize_spec(SPEC)
+    jobs = slide_jobs(spec)
+    build_incremental(jobs, output, add_job_slide, code={"code": {"images": "a"}, "packages": {}})
+
+    same = build_incremental(jobs, output, add_job_slide, code={"code": {"images": "a"}, "packages": {}})
+    assert same["rebuilt"] == 0
+    # A helper such as add_fitted_picture or a package upgrade is outside the slide fingerprints.
+    changed = build_incremental(jobs, output, add_job_slide, code={"code": {"images": "b"}, "packages": {}})
+    assert changed["reused"] == 0
+
+
+def test_cli_incremental_build_records_the_code_fingerprint(workdir, capsys):
+    output = workdir / "cli.pptx"
+    build_presentation(normalize_spec(SPEC), output, incremental=True)
+    build_presentation(normalize_spec(SPEC), output, incremental=True)
+    assert "Reused 5/5 slides" in capsys.readouterr().out
+    manifest = json.loads((workdir / "cli.pptx.build.json").read_text(encoding="utf-8"))
+    assert set(manifest["code"]["code"]) >= {"generate_presentation", "charts", "images"}
@@ -0,0 +1,105 @@
+import pytest
+
+import overflow
+from fonts import FontRegistry
+
+
+@pytest.fixture
+def no_metric_fonts(monkeypatch):
+    monkeypatch.setattr(overflow, "REGULAR_FAMILIES", ("Missing-Regular.ttf",))
+    monkeypatch.setattr(overflow, "BOLD_FAMILIES", ("Missing-Bold.ttf",))
+    overflow.text_family.cache_clear()
+    yield
+    overflow.text_family.cache_clear()
+
+
+def test_missing_font_still_measures_at_the_requested_size():
+    fonts = FontRegistry()
+    fallback = fonts.text_width("Hello world", 24, "Missing-Regular.ttf")
+    installed = fonts.text_width("Hello world", 24, "DejaVuSans.ttf")
+    # Pillow's built-in font is narrower than DejaVu but must be the same order of magnitude.
+    assert installed * 0.6 < fallback < installed * 1.4
+    assert fonts.scalable("Missing-Regular.ttf")
+
+
+def test_overflow_warns_when_no_metric_font_is_installed(no_metric_fonts, capsys):
+    assert overflow.text_family() == "Missing-Regular.ttf"
+    assert "overflow estimates use Pillow's built-in font" in capsys.readouterr().err
+    assert overflow.wrapped_lines("word " * 40, 24, 6 * 914400, overflow.text_family()) > 1
+
+
+def test_overflow_fails_without_a_scalable_font(no_metric_fonts, monkeypatch):
+    monkeypatch.setattr(overflow.FONTS, "scalable", lambda family: False)
+    with pytest.raises(ValueError, match="no scalable font"):
+        overflow.text_family(bold=True)
+
+
+LONG_BULLETS = [f"Bullet {index} explains one more detail of the rollout plan" for index in range(14)]
+
+
+def bullet_slide(bullets, title="Rollout"):
+    from generate_presentation import add_bullet_slide
+    from templates import new_presentation
+
+    return add_bullet_slide(new_presentation(), title, bullets)
+
+
+def body_sizes(slide) -> list[int]:
+    box = next(shape for shape in slide.shapes if not shape.is_placeholder)
+    return [int(element.get("sz")) for element in box._element.iter("{*}rPr", "{*}defRPr") if element.get("sz")]
+
+
+def test_text_that_fits_is_left_alone(capsys):
+    slide = bullet_slide(["Short point", "Another"])
+    for mode in overflow.OVERFLOW_MODES:
+        assert overflow.check_slide(slide, 0, mode) == []
+    assert capsys.readouterr().err == ""
+
+
+def test_warn_reports_without_changing_the_slide(capsys):
+    slide = bullet_slide(LONG_BULLETS)
+    before = body_sizes(slide)
+
+    issues = overflow.check_slide(slide, 2, "warn")
+    assert [issue["slide"] for issue in issues] == [3]
+    assert issues[0]["needed_in"] > issues[0]["box_in"]
+    assert "warning: slide 3 ('Rollout')" in capsys.readouterr().err
+    assert body_sizes(slide) == before
+
+
+def test_shrink_lowers_font_sizes_until_the_text_fits(capsys):
+    slide = bullet_slide(LONG_BULLETS)
+
+    issues = overflow.check_slide(slide, 0, "shrink")
+    fitted = issues[0]["fitted_pt"]
+    assert overflow.MIN_SIZE_PT <= fitted < 24
+    assert set(body_sizes(slide)) == {fitted * 100}
+    assert "to fit" in capsys.readouterr().err
+    assert overflow.check_slide(slide, 0, "warn") == []
+
+
+def test_shrink_stops_at_the_minimum_size(capsys):
+    slide = bullet_slide(LONG_BULLETS * 4)
+
+    issues = overflow.check_slide(slide, 0, "shrink")
+    assert issues[0]["fitted_pt"] == overflow.MIN_SIZE_PT
+    assert "still overflows" in capsys.readouterr().err
+
+
+def test_error_mode_fails_the_build():
+    with pytest.raises(ValueError, match="slide 1 .* text needs"):
+        overflow.check_slide(bullet_slide(LONG_BULLETS), 0, "error")
+
+
+def test_title_placeholder_takes_its_size_from_the_layout():
+    from pptx.util import Emu
+
+    slide = bullet_slide(["Short point"], title="A title long enough to need more lines than its box holds " * 2)
+    title = slide.shapes.title
+    assert title._element.spPr.find("{*}xfrm") is None  # no size of its own
+
+    issues = overflow.check_slide(slide, 0, "warn")
+    assert [issue["shape"] for issue in issues] == [title.name]
+    layout_height = slide.slide_layout.placeholders[0].height
+    assert issues[0]["box_in"] == round((layout_height - Emu(91440)) / 914400, 2)
+    assert issues[0]["size_pt"] == 40
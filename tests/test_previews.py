@@ -0,0 +1,26 @@
+import previews
+from conftest import SPEC
+from deck_spec import normalize_spec
+
+
+def test_resized_picture_memo_is_bounded(workdir, monkeypatch):
+    from PIL import Image
+
+    monkeypatch.setattr(previews, "MAX_PICTURES", 3)
+    previews._pictures.clear()
+    canvas = previews.Canvas((12192000, 6858000), 320)
+    source = workdir / "swatch.png"
+    Image.new("RGB", (40, 20), "green").save(source)
+    for width in range(1, 6):
+        canvas.picture(source, 0, 0, width=previews.inches(width))
+    assert len(previews._pictures) == 3
+    # The most recent sizes are the ones kept.
+    assert [key[1][0] for key in previews._pictures] == [canvas.px(previews.inches(width)) for width in (3, 4, 5)]
+
+
+def test_thumbnails_are_cached_per_slide(workdir):
+    cache_dir = workdir / "previews"
+    first = previews.render_previews(normalize_spec(SPEC), cache_dir=cache_dir)
+    assert len(first) == len(SPEC["slides"]) + 1
+    assert all(path.exists() for path in first)
+    assert previews.render_previews(normalize_spec(SPEC), cache_dir=cache_dir) == first
@@ -0,0 +1,60 @@
+import io
+import zipfile
+
+import pytest
+
+from conftest import SPEC, deck_parts, deck_text
+from deck_spec import normalize_spec
+from generate_presentation import build_presentation, deck_hash
+
+
+def build_bytes(**options) -> bytes:
+    buffer = io.BytesIO()
+    build_presentation(normalize_spec(SPEC), buffer, reproducible=True, **options)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("options", [{}, {"stream": True}, {"in_memory": True}], ids=["default", "stream", "in-memory"])
+def test_two_builds_are_byte_identical(workdir, options):
+    assert build_bytes(**options) == build_bytes(**options)
+
+
+def test_in_memory_build_matches_disk_build(workdir):
+    assert build_bytes(in_memory=True) == build_bytes()
+
+
+def test_reproducible_deck_opens_with_the_same_content(workdir):
+    regular = build_presentation(normalize_spec(SPEC), workdir / "regular.pptx")
+    data = build_bytes()
+
+    assert deck_text(io.BytesIO(data)) == deck_text(regular)
+    assert deck_parts(io.BytesIO(data)) == deck_parts(regular)
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        assert package.testzip() is None
+        names = package.namelist()
+        assert names[0] == "[Content_Types].xml"
+        assert names[1:] == sorted(names[1:])
+        assert {info.date_time for info in package.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        # Chart workbooks are packages too and are normalized the same way.
+        for name in names:
+            if name.endswith(".xlsx"):
+                with zipfile.ZipFile(io.BytesIO(package.read(name))) as workbook:
+                    assert {info.date_time for info in workbook.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+
+def test_source_date_epoch_sets_the_timestamps(workdir, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    data = build_bytes()
+
+    assert data == build_bytes()
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        assert {info.date_time for info in package.infolist()} == {(2023, 11, 14, 22, 13, 20)}
+        assert b"2023-11-14T22:13:20Z" in package.read("docProps/core.xml")
+
+
+def test_deck_hash_tracks_build_inputs(workdir):
+    base = deck_hash(SPEC)
+    assert deck_hash(SPEC) == base
+    assert deck_hash(SPEC, overflow="shrink") != base
+    assert deck_hash(SPEC, slides=SPEC["slides"][:2]) != base
+    assert deck_hash({**SPEC, "name": "renamed", "output": "elsewhere.pptx"}) == base
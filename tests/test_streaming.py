@@ -0,0 +1,60 @@
+import io
+import re
+import zipfile
+
+import pytest
+
+from conftest import SPEC, deck_parts, deck_text
+from deck_spec import normalize_spec
+from generate_presentation import build_presentation
+
+
+def test_streamed_deck_matches_regular_build(workdir):
+    spec = normalize_spec(SPEC)
+    streamed = build_presentation(spec, workdir / "streamed.pptx", stream=True)
+    regular = build_presentation(spec, workdir / "regular.pptx")
+
+    assert deck_text(streamed) == deck_text(regular)
+    assert deck_parts(streamed) == deck_parts(regular)
+    streamed_names, streamed_types = package_contents(streamed)
+    regular_names, regular_types = package_contents(regular)
+    assert len(streamed_names) == len(set(streamed_names)) == len(regular_names)
+    # Content types are written last, once every part is known, and must still type every part.
+    assert streamed_types["overrides"] == regular_types["overrides"]
+    for name in streamed_names:
+        if name != "[Content_Types].xml":
+            assert f"/{name}" in streamed_types["overrides"] or name.rsplit(".", 1)[-1] in streamed_types["defaults"], name
+
+
+def package_contents(path) -> tuple[list[str], dict[str, dict[str, str]]]:
+    with zipfile.ZipFile(path) as package:
+        assert package.testzip() is None
+        content_types = package.read("[Content_Types].xml").decode("utf-8")
+        names = package.namelist()
+    return names, {
+        "defaults": dict(re.findall(r'<Default Extension="([^"]+)" ContentType="([^"]+)"', content_types)),
+        "overrides": dict(re.findall(r'<Override PartName="([^"]+)" ContentType="([^"]+)"', content_types)),
+    }
+
+
+def test_lazy_slides_stream_to_a_writable_stream(workdir):
+    slides = ({"title": f"Item {index}", "bullets": [f"Detail {index}"], "image": "objectives.png"} for index in range(30))
+    buffer = io.BytesIO()
+    build_presentation(normalize_spec(SPEC), buffer, stream=True, slides=slides)
+
+    texts = deck_text(io.BytesIO(buffer.getvalue()))
+    assert len(texts) == 31
+    assert [slide[0] for slide in texts[1:]] == [f"Item {index}" for index in range(30)]
+    # One shared image is stored once however many slides place it.
+    with zipfile.ZipFile(buffer) as package:
+        media = [name for name in package.namelist() if name.startswith("ppt/media/")]
+    assert len(media) == 3
+
+
+def test_failed_stream_leaves_no_output(workdir):
+    output = workdir / "failed.pptx"
+    slides = [{"title": "Fine", "bullets": []}, {"title": "", "bullets": []}]
+    with pytest.raises(ValueError):
+        build_presentation(normalize_spec(SPEC), output, stream=True, slides=iter(slides))
+    assert not output.exists()
+    assert not list(workdir.glob("failed.pptx*"))
@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+
+_NULL_SPAN = nullcontext()
+_active = None
+
+
+class Tracer:
+    """Collects timing spans, optional tracemalloc deltas and an optional cProfile capture."""
+
+    def __init__(self, memory: bool = False, profile: bool = False):
+        self.memory = memory
+        self.spans: list[dict] = []
+        self.origin_ns = time.perf_counter_ns()
+        self.profiler = None
+        if profile:
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+        self.top_allocations: list[dict] = []
+        self._depth = 0
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profiler:
+            self.profiler.enable()
+
+    def stop(self):
+        if self.profiler:
+            self.profiler.disable()
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            self.top_allocations = [
+                {"location": str(stat.traceback), "bytes": stat.size, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:20]
+            ]
+            tracemalloc.stop()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        depth = self._depth
+        self._depth += 1
+        memory_before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - started
+            self._depth -= 1
+            if self.memory:
+                attrs["alloc_bytes"] = tracemalloc.get_traced_memory()[0] - memory_before
+            self.add_span(name, started, duration, depth=depth, **attrs)
+
+    def add_span(self, name: str, start_ns: int, duration_ns: int, pid: int | None = None, depth: int = 0, **attrs):
+        """Record a span measured elsewhere, e.g. in a pool worker (``perf_counter_ns`` is system-wide on Linux/macOS)."""
+        self.spans.append(
+            {
+                "name": name,
+                "start_ms": (start_ns - self.origin_ns) / 1e6,
+                "duration_ms": duration_ns / 1e6,
+                "depth": depth,
+                "pid": pid or os.getpid(),
+                "tid": threading.get_ident(),
+                "attrs": attrs,
+            }
+        )
+
+    def summary(self) -> dict:
+        totals: dict[str, dict] = {}
+        for span in self.spans:
+            total = totals.setdefault(span["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            total["count"] += 1
+            total["total_ms"] += span["duration_ms"]
+            total["max_ms"] = max(total["max_ms"], span["duration_ms"])
+        return {"totals": totals, "spans": self.spans, "top_allocations": self.top_allocations}
+
+    def chrome_trace(self) -> dict:
+        events = [
+            {
+                "name": span["name"],
+                "ph": "X",
+                "ts": span["start_ms"] * 1000,
+                "dur": span["duration_ms"] * 1000,
+                "pid": span["pid"],
+                "tid": span["tid"],
+                "args": span["attrs"],
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, output_path: Path) -> list[Path]:
+        """Write ``<deck>.trace.json``, ``<deck>.trace-events.json`` and, when profiling, ``<deck>.prof``."""
+        output_path = Path(output_path)
+        summary_path = output_path.with_name(f"{output_path.name}.trace.json")
+        events_path = output_path.with_name(f"{output_path.name}.trace-events.json")
+        summary_path.write_text(json.dumps(self.summary(), indent=2, default=str), encoding="utf-8")
+        events_path.write_text(json.dumps(self.chrome_trace(), default=str), encoding="utf-8")
+        written = [summary_path, events_path]
+        if self.profiler:
+            profile_path = output_path.with_name(f"{output_path.name}.prof")
+            self.profiler.dump_stats(profile_path)
+            written.append(profile_path)
+        return written
+
+
+def start(memory: bool = False, profile: bool = False) -> Tracer:
+    global _active
+    _active = Tracer(memory=memory, profile=profile)
+    _active.start()
+    return _active
+
+
+def stop() -> Tracer | None:
+    global _active
+    tracer, _active = _active, None
+    if tracer:
+        tracer.stop()
+    return tracer
+
+
+def active() -> Tracer | None:
+    return _active
+
+
+def span(name: str, **attrs):
+    """Time a block when tracing is on; a shared no-op context otherwise."""
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, **attrs)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+import tracing
+
+
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+# Parts whose DrawingML runs carry user-visible text. Chart category labels are
+# left alone because they must stay in step with the embedded workbook.
+_TEXT_PARTS = re.compile(r"^ppt/(slides|notesSlides|charts)/[^/]+\.xml$")
+
+
+def load_string_tables(directory: Path) -> dict[str, dict[str, str]]:
+    """Read ``<locale>.json`` files mapping source paragraph text to its translation."""
+    tables = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        table = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(table, dict) or not all(isinstance(value, str) for value in table.values()):
+            raise ValueError(f"{path}: string table must map source text to translated text")
+        tables[path.stem] = table
+    if not tables:
+        raise ValueError(f"no <locale>.json string tables in {directory}")
+    return tables
+
+
+def variant_path(output_path: Path, locale: str) -> Path:
+    return output_path.with_name(f"{output_path.stem}.{locale}{output_path.suffix}")
+
+
+class TextPart:
+    """One parsed text-bearing part and its paragraphs, each as ``(source text, a:t elements)``."""
+
+    def __init__(self, blob: bytes):
+        from lxml import etree
+
+        self.root = etree.fromstring(blob)
+        self.paragraphs = []
+        for paragraph in self.root.iter(f"{{{_A_NS}}}p"):
+            runs = list(paragraph.iter(f"{{{_A_NS}}}t"))
+            if runs:
+                self.paragraphs.append(("".join(run.text or "" for run in runs), runs))
+
+    def translate(self, table: dict[str, str], locale: str) -> tuple[bytes | None, int, int]:
+        """Serialize the part with ``table`` applied, or None when no paragraph changes."""
+        from lxml import etree
+
+        changed = []
+        missing = 0
+        for source, runs in self.paragraphs:
+            text = table.get(source)
+            if text is None:
+                missing += bool(source.strip())
+                continue
+            if text == source:
+                continue
+            langs = _run_langs(runs)
+            changed.append((runs, [run.text for run in runs], langs))
+            # The first run keeps its formatting and takes the whole translation.
+            runs[0].text = text
+            for run in runs[1:]:
+                run.text = ""
+            for rPr in langs:
+                rPr.set("lang", locale)
+        if not changed:
+            return None, 0, missing
+        blob = etree.tostring(self.root, xml_declaration=True, encoding="UTF-8", standalone=True)
+        for runs, texts, rPrs in changed:
+            for run, text in zip(runs, texts):
+                run.text = text
+            for rPr, lang in rPrs.items():
+                if lang is None:
+                    rPr.attrib.pop("lang", None)
+                else:
+                    rPr.set("lang", lang)
+        return blob, len(changed), missing
+
+
+def _run_langs(runs) -> dict:
+    rPrs = (run.getparent().find(f"{{{_A_NS}}}rPr") for run in runs)
+    return {rPr: rPr.get("lang") for rPr in rPrs if rPr is not None}
+
+
+def build_variants(source: Path | bytes, tables: dict[str, dict[str, str]], output_path: Path) -> dict[str, dict]:
+    """Write one translated copy of a built deck per string table.
+
+    The source package is read and its text parts parsed once. Every other
+    member (media, layouts, masters, embedded workbooks) is copied into each
+    variant as-is, and a text part is re-serialized only when a translation
+    actually changes it. Source paragraphs missing from a table keep their text
+    and are counted in the returned ``missing`` total.
+    """
+    data = source if isinstance(source, bytes) else Path(source).read_bytes()
+    output_path = Path(output_path)
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        members = [(info, package.read(info)) for info in package.infolist()]
+    with tracing.span("variants:parse"):
+        text_parts = {info.filename: TextPart(blob) for info, blob in members if _TEXT_PARTS.match(info.filename)}
+
+    results = {}
+    for locale, table in tables.items():
+        target = variant_path(output_path, locale)
+        translated = missing = 0
+        with tracing.span("variant", locale=locale), zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as out:
+            for info, blob in members:
+                part = text_parts.get(info.filename)
+                if part is not None:
+                    changed, count, absent = part.translate(table, locale)
+                    blob = changed or blob
+                    translated += count
+                    missing += absent
+                out.writestr(info, blob)
+        results[locale] = {"output": str(target), "translated": translated, "missing": missing}
+    return results
+
+
+def extract_strings(source: Path | bytes) -> list[str]:
+    """Distinct paragraph texts of a built deck, in order, as a starting point for a string table."""
+    data = source if isinstance(source, bytes) else Path(source).read_bytes()
+    seen = {}
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        for name in package.namelist():
+            if _TEXT_PARTS.match(name):
+                for text, _ in TextPart(package.read(name)).paragraphs:
+                    if text.strip():
+                        seen.setdefault(text, None)
+    return list(seen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write per-locale copies of a built deck from string tables.")
+    parser.add_argument("deck", type=Path, help="built .pptx to translate")
+    parser.add_argument("strings", type=Path, nargs="?", help="directory of <locale>.json string tables")
+    parser.add_argument("--extract", type=Path, help="write a string table skeleton of every paragraph to this file instead")
+    args = parser.parse_args(argv)
+    if args.extract:
+        table = {text: text for text in extract_strings(args.deck)}
+        args.extract.write_text(json.dumps(table, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Wrote {len(table)} strings to {args.extract}")
+        return 0
+    if args.strings is None:
+        parser.error("a strings directory is required unless --extract is given")
+    for locale, result in build_variants(args.deck, load_string_tables(args.strings), args.deck).items():
+        print(f"{locale}: {result['translated']} paragraphs translated, {result['missing']} missing -> {result['output']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())